@@ -11,7 +11,7 @@ from pytdbot import types, Client
 __version__ = "1.2.4"
 StartTime = datetime.now()
 
-from TgMusic.core import call, tg, db, config
+from TgMusic.core import call, tg, db, config, HttpxClient
 
 
 class Bot(Client):
@@ -43,15 +43,22 @@ class Bot(Client):
 
     async def start_clients(self) -> None:
         """Initialize all client sessions."""
-        try:
-            await asyncio.gather(
-                *[
-                    self.call.start_client(config.API_ID, config.API_HASH, session_str)
-                    for session_str in config.SESSION_STRINGS
-                ]
-            )
-        except Exception as exc:
-            raise SystemExit(1) from exc
+        # Cap concurrent logins so many sessions don't trip flood waits
+        sem = asyncio.Semaphore(8)
+
+        async def _bounded_start(session_str: str) -> None:
+            async with sem:
+                await self.call.start_client(config.API_ID, config.API_HASH, session_str)
+
+        results = await asyncio.gather(
+            *[_bounded_start(session_str) for session_str in config.SESSION_STRINGS],
+            return_exceptions=True,
+        )
+        failed = [r for r in results if isinstance(r, Exception)]
+        for exc in failed:
+            self.logger.error("Session failed to start: %s", exc)
+        if failed and len(failed) == len(results):
+            raise SystemExit(1) from failed[0]
 
     async def initialize_components(self) -> None:
         from TgMusic.core import save_all_cookies
@@ -69,9 +76,11 @@ class Bot(Client):
     async def stop_task(self) -> None:
         self.logger.info("Stopping bot...")
         try:
+            await self.call.flush_assistants()
             shutdown_tasks = [
                 self.db.close(),
                 self.call.stop_all_clients(),
+                HttpxClient.close_all(),
             ]
             await asyncio.gather(*shutdown_tasks)
         except Exception as e:
@@ -16,6 +16,7 @@ from ._database import db
 from ._dataclass import CachedTrack, MusicTrack, PlatformTracks, TrackInfo
 from ._downloader import DownloaderWrapper
 from ._filters import Filter
+from ._httpx import HttpxClient
 from ._save_cookies import save_all_cookies
 from ._telegram import tg
 from ._tgcalls import call
@@ -46,4 +47,5 @@ __all__ = [
     "PlatformTracks",
     "SupportButton",
     "Filter",
+    "HttpxClient",
 ]
\ No newline at end of file
@@ -35,6 +35,10 @@ class AdminCache:
         self.chat_id = chat_id
         self.user_info = user_info
         self.cached = cached
+        # user_id -> member, built once so lookups don't scan the admin list
+        self.by_user_id = {
+            member["member_id"]["user_id"]: member for member in user_info
+        }
 
 
 async def load_admin_cache(
@@ -68,14 +72,8 @@ async def get_admin_cache_user(
     if admin_list is None:
         return False, None
 
-    return next(
-        (
-            (True, user_info)
-            for user_info in admin_list.user_info
-            if user_info["member_id"]["user_id"] == user_id
-        ),
-        (False, None),
-    )
+    user_info = admin_list.by_user_id.get(user_id)
+    return (True, user_info) if user_info is not None else (False, None)
 
 
 ANON = TTLCache(maxsize=250, ttl=60)
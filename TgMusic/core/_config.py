@@ -68,9 +68,11 @@ class BotConfig:
 
         # Developer
         devs_env: Optional[str] = os.getenv("DEVS")
-        self.DEVS: list[int] = list(map(int, devs_env.split())) if devs_env else []
-        if self.OWNER_ID and self.OWNER_ID not in self.DEVS:
-            self.DEVS.append(self.OWNER_ID)
+        devs = set(map(int, devs_env.split())) if devs_env else set()
+        if self.OWNER_ID:
+            devs.add(self.OWNER_ID)
+        # Only ever used for membership checks in dev commands
+        self.DEVS: frozenset[int] = frozenset(devs)
 
         # Validate configuration
         self._validate_config()
@@ -2,10 +2,11 @@
 #  Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 
+import asyncio
 from typing import Optional
 
 from cachetools import TTLCache
-from pymongo import AsyncMongoClient
+from pymongo import AsyncMongoClient, UpdateOne
 from pymongo.errors import ConnectionFailure
 
 from TgMusic.logger import LOGGER
@@ -20,8 +21,10 @@ class Database:
         self.users_db = _db["users"]
         self.bot_db = _db["bot"]
 
-        self.chat_cache = TTLCache(maxsize=1000, ttl=1200)
+        self.chat_cache = TTLCache(maxsize=10_000, ttl=1200)
         self.bot_cache = TTLCache(maxsize=1000, ttl=1200)
+        # chat_id -> lookup in progress, shared by concurrent cache misses
+        self._chat_inflight: dict[int, asyncio.Task] = {}
 
     async def ping(self) -> None:
         try:
@@ -39,20 +42,37 @@ class Database:
     async def get_chat(self, chat_id: int) -> Optional[dict]:
         if chat_id in self.chat_cache:
             return self.chat_cache[chat_id]
+
+        # A burst of handlers for an uncached chat shares a single query. The
+        # lookup runs as its own task, so cancelling any one caller (the first
+        # included) doesn't fail the others
+        task = self._chat_inflight.get(chat_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_chat(chat_id))
+            self._chat_inflight[chat_id] = task
+            task.add_done_callback(lambda _: self._chat_inflight.pop(chat_id, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_chat(self, chat_id: int) -> Optional[dict]:
         try:
-            if chat := await self.chat_db.find_one({"_id": chat_id}):
-                self.chat_cache[chat_id] = chat
-            return chat
+            chat = await self.chat_db.find_one({"_id": chat_id})
         except Exception as e:
             LOGGER.warning("Error getting chat: %s", e)
             return None
 
+        # Cache misses as well, so chats without stored settings don't hit
+        # the database on every status lookup
+        chat = chat or {}
+        self.chat_cache[chat_id] = chat
+        return chat
+
     async def add_chat(self, chat_id: int) -> None:
-        if await self.get_chat(chat_id) is None:
+        if not await self.get_chat(chat_id):
             LOGGER.info("Added chat: %s", chat_id)
             await self.chat_db.update_one(
                 {"_id": chat_id}, {"$setOnInsert": {}}, upsert=True
             )
+            self.chat_cache[chat_id] = {"_id": chat_id}
 
     async def _update_chat_field(self, chat_id: int, key: str, value) -> None:
         await self.chat_db.update_one(
@@ -76,6 +96,24 @@ class Database:
     async def set_assistant(self, chat_id: int, assistant: str) -> None:
         await self._update_chat_field(chat_id, "assistant", assistant)
 
+    async def bulk_set_assistant(self, assignments: dict[int, str]) -> None:
+        if not assignments:
+            return
+
+        # Update cache first so lookups during the write already see the values
+        for chat_id, assistant in assignments.items():
+            cached = self.chat_cache.get(chat_id, {})
+            cached["assistant"] = assistant
+            self.chat_cache[chat_id] = cached
+
+        await self.chat_db.bulk_write(
+            [
+                UpdateOne({"_id": chat_id}, {"$set": {"assistant": assistant}}, upsert=True)
+                for chat_id, assistant in assignments.items()
+            ],
+            ordered=False,
+        )
+
     async def clear_all_assistants(self) -> int:
         # Clear assistants from all chats in the database
         result = await self.chat_db.update_many(
@@ -153,14 +191,21 @@ class Database:
         return await self.users_db.find_one({"_id": user_id}) is not None
 
     async def get_all_users(self) -> list[int]:
-        return [user["_id"] async for user in self.users_db.find()]
+        return [user["_id"] async for user in self.users_db.find({}, {"_id": 1})]
 
     async def get_all_chats(self) -> list[int]:
-        return [chat["_id"] async for chat in self.chat_db.find()]
+        return [chat["_id"] async for chat in self.chat_db.find({}, {"_id": 1})]
+
+    async def count_users(self) -> int:
+        return await self.users_db.count_documents({})
+
+    async def count_chats(self) -> int:
+        return await self.chat_db.count_documents({})
 
     async def get_logger_status(self, bot_id: int) -> bool:
-        if bot_id in self.bot_cache and self.bot_cache[bot_id].get("logger"):
-            return self.bot_cache[bot_id].get("logger")
+        cached = self.bot_cache.get(bot_id)
+        if cached and "logger" in cached:
+            return cached["logger"]
 
         bot_data = await self.bot_db.find_one({"_id": bot_id})
         status = bot_data.get("logger", False) if bot_data else False
@@ -183,8 +228,9 @@ class Database:
         self.bot_cache[bot_id] = cached
 
     async def get_auto_end(self, bot_id: int) -> bool:
-        if bot_id in self.bot_cache and self.bot_cache[bot_id].get("auto_end"):
-            return self.bot_cache[bot_id].get("auto_end")
+        cached = self.bot_cache.get(bot_id)
+        if cached and "auto_end" in cached:
+            return cached["auto_end"]
 
         bot_data = await self.bot_db.find_one({"_id": bot_id})
         status = bot_data.get("auto_end", True) if bot_data else True
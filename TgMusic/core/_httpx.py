@@ -13,11 +13,19 @@ from urllib.parse import unquote
 
 import aiofiles
 import httpx
+import ujson
 from aiofiles import os
 
 from ._config import config
 from TgMusic.logger import LOGGER
 
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 @dataclass
 class DownloadResult:
@@ -33,6 +41,12 @@ class HttpxClient:
     CHUNK_SIZE = 1024 * 1024
     MAX_RETRIES = 2
     BACKOFF_FACTOR = 1.0
+    POOL_LIMITS = httpx.Limits(
+        max_connections=100, max_keepalive_connections=50, keepalive_expiry=30
+    )
+    # Underlying clients shared by every instance with the same settings, so
+    # connections stay pooled across requests instead of a new pool per call
+    _sessions: dict[tuple[int, int], httpx.AsyncClient] = {}
 
     def __init__(
         self,
@@ -43,22 +57,38 @@ class HttpxClient:
         self._timeout = timeout
         self._download_timeout = download_timeout
         self._max_redirects = max_redirects
-        self._session = httpx.AsyncClient(
-            timeout=httpx.Timeout(
-                connect=self._timeout,
-                read=self._timeout,
-                write=self._timeout,
-                pool=self._timeout,
-            ),
-            follow_redirects=max_redirects > 0,
-            max_redirects=max_redirects,
-        )
-
-    async def close(self) -> None:
-        try:
-            await self._session.aclose()
-        except Exception as e:
-            LOGGER.error("Error closing HTTP session: %s", repr(e), exc_info=True)
+        self._session = self._get_session(timeout, max_redirects)
+
+    @classmethod
+    def _get_session(cls, timeout: int, max_redirects: int) -> httpx.AsyncClient:
+        key = (timeout, max_redirects)
+        session = cls._sessions.get(key)
+        if session is None or session.is_closed:
+            session = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    connect=timeout,
+                    read=timeout,
+                    write=timeout,
+                    pool=timeout,
+                ),
+                limits=cls.POOL_LIMITS,
+                # Multiplex concurrent requests to the same host over one connection
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=max_redirects > 0,
+                max_redirects=max_redirects,
+            )
+            cls._sessions[key] = session
+        return session
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the shared HTTP sessions; call once at shutdown."""
+        sessions, cls._sessions = cls._sessions, {}
+        for session in sessions.values():
+            try:
+                await session.aclose()
+            except Exception as e:
+                LOGGER.error("Error closing HTTP session: %s", repr(e), exc_info=True)
 
     @staticmethod
     def _get_headers(url: str, base_headers: Dict[str, str]) -> Dict[str, str]:
@@ -217,7 +247,8 @@ class HttpxClient:
                     duration,
                     response.status_code,
                 )
-                return response.json()
+                # ujson is a declared dependency and parses faster than stdlib json
+                return ujson.loads(response.content)
 
             except httpx.RequestError as e:
                 last_error = str(e)
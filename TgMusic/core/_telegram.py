@@ -2,13 +2,24 @@
 #  Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 
+import asyncio
+from time import monotonic
 from typing import Optional, Union
 
-from cachetools import TTLCache
 from pytdbot import types
 
 from TgMusic.logger import LOGGER
 
+# pytdbot content classes are concrete leaves, so exact type membership is enough
+_UNSUPPORTED_TYPES = frozenset(
+    {
+        types.MessageText,
+        types.MessagePhoto,
+        types.MessageSticker,
+        types.MessageAnimation,
+    }
+)
+
 
 class Telegram:
     """
@@ -16,35 +27,36 @@ class Telegram:
     """
 
     MAX_FILE_SIZE = 500 * 1024 * 1024  # 500MB
-    UNSUPPORTED_TYPES = (
-        types.MessageText,
-        types.MessagePhoto,
-        types.MessageSticker,
-        types.MessageAnimation,
-    )
-    DownloaderCache = TTLCache(maxsize=5000, ttl=600)
-
-    def __init__(self):
-        self._file_info: Optional[tuple[int, str]] = None
-
-    @staticmethod
-    def _extract_file_info(content: types.MessageContent) -> tuple[int, str]:
+    CACHE_TTL = 600  # seconds
+    CACHE_SWEEP_INTERVAL = 60  # seconds
+    # unique_id -> (expiry timestamp, metadata); expired entries are dropped
+    # lazily on access and by a periodic sweep
+    DownloaderCache: dict[str, tuple[float, dict]] = {}
+    _sweeper: Optional[asyncio.Task] = None
+    # unique_id -> download in progress, shared by concurrent requests for the same file
+    _inflight: dict[str, asyncio.Task] = {}
+    # Exact content type -> (file size, file name); documents are handled separately
+    _EXTRACTORS = {
+        types.MessageVideo: lambda c: (
+            c.video.video.size,
+            c.video.file_name or "Video.mp4",
+        ),
+        types.MessageAudio: lambda c: (
+            c.audio.audio.size,
+            c.audio.file_name or "Audio.mp3",
+        ),
+        types.MessageVoiceNote: lambda c: (c.voice_note.voice.size, "VoiceNote.ogg"),
+        types.MessageVideoNote: lambda c: (c.video_note.video.size, "VideoNote.mp4"),
+    }
+
+    __slots__ = ()
+
+    @classmethod
+    def _extract_file_info(cls, content: types.MessageContent) -> tuple[int, str]:
         try:
-            if isinstance(content, types.MessageVideo):
-                return (
-                    content.video.video.size,
-                    content.video.file_name or "Video.mp4",
-                )
-            elif isinstance(content, types.MessageAudio):
-                return (
-                    content.audio.audio.size,
-                    content.audio.file_name or "Audio.mp3",
-                )
-            elif isinstance(content, types.MessageVoiceNote):
-                return content.voice_note.voice.size, "VoiceNote.ogg"
-            elif isinstance(content, types.MessageVideoNote):
-                return content.video_note.video.size, "VideoNote.mp4"
-            elif isinstance(content, types.MessageDocument):
+            if extractor := cls._EXTRACTORS.get(type(content)):
+                return extractor(content)
+            if isinstance(content, types.MessageDocument):
                 mime = (content.document.mime_type or "").lower()
                 if mime.startswith(("audio/", "video/")):
                     return (
@@ -58,21 +70,29 @@ class Telegram:
         LOGGER.info("Unsupported content type: %s", type(content).__name__)
         return 0, "UnknownMedia"
 
-    def is_valid(self, msg: Optional[types.Message]) -> bool:
+    def _playable_file_info(
+        self, msg: Optional[types.Message]
+    ) -> Optional[tuple[int, str]]:
+        """Return (file size, file name) for a playable media message, else None."""
         if not msg or isinstance(msg, types.Error):
-            return False
+            return None
 
         content = msg.content
-        if isinstance(content, self.UNSUPPORTED_TYPES):
-            return False
+        if type(content) in _UNSUPPORTED_TYPES:
+            return None
 
-        file_size, _ = self._extract_file_info(content)
-        return 0 < file_size <= self.MAX_FILE_SIZE
+        file_info = self._extract_file_info(content)
+        return file_info if 0 < file_info[0] <= self.MAX_FILE_SIZE else None
+
+    def is_valid(self, msg: Optional[types.Message]) -> bool:
+        return self._playable_file_info(msg) is not None
 
     async def download_msg(
         self, dl_msg: types.Message, message: types.Message
     ) -> tuple[Union[types.Error, types.LocalFile], str]:
-        if not self.is_valid(dl_msg):
+        # Validate and extract in one pass instead of is_valid() + a second extraction
+        file_info = self._playable_file_info(dl_msg)
+        if file_info is None:
             return (
                 types.Error(code=0, message="Invalid or unsupported media file."),
                 "InvalidMedia",
@@ -80,26 +100,59 @@ class Telegram:
 
         unique_id = dl_msg.remote_unique_file_id
         chat_id = message.chat_id if message else dl_msg.chat_id
-        file_size, file_name = self._extract_file_info(dl_msg.content)
+        file_name = file_info[1]
+
+        if self.get_cached_metadata(unique_id) is None:
+            Telegram._ensure_sweeper()
+            Telegram.DownloaderCache[unique_id] = (
+                monotonic() + Telegram.CACHE_TTL,
+                {
+                    "chat_id": chat_id,
+                    "remote_file_id": dl_msg.remote_file_id,
+                    "filename": file_name,
+                    "message_id": message.id,
+                },
+            )
 
-        if unique_id not in Telegram.DownloaderCache:
-            Telegram.DownloaderCache[unique_id] = {
-                "chat_id": chat_id,
-                "remote_file_id": dl_msg.remote_file_id,
-                "filename": file_name,
-                "message_id": message.id,
-            }
-        return await dl_msg.download(), file_name
+        # The download runs as its own task, so cancelling any one caller (the
+        # first included) doesn't fail the others waiting on the same file
+        task = Telegram._inflight.get(unique_id)
+        if task is None:
+            task = asyncio.ensure_future(dl_msg.download())
+            Telegram._inflight[unique_id] = task
+            task.add_done_callback(lambda _: Telegram._inflight.pop(unique_id, None))
+        return await asyncio.shield(task), file_name
 
     @staticmethod
     def get_cached_metadata(
         unique_id: str,
     ) -> Optional[dict[str, Union[int, str, str, int]]]:
-        return Telegram.DownloaderCache.get(unique_id)
+        entry = Telegram.DownloaderCache.get(unique_id)
+        if entry is None:
+            return None
+        if entry[0] < monotonic():
+            Telegram.DownloaderCache.pop(unique_id, None)
+            return None
+        return entry[1]
 
     @staticmethod
     def clear_cache(unique_id: str):
-        return Telegram.DownloaderCache.pop(unique_id, None)
+        entry = Telegram.DownloaderCache.pop(unique_id, None)
+        return entry[1] if entry else None
+
+    @staticmethod
+    def _ensure_sweeper() -> None:
+        if Telegram._sweeper is None or Telegram._sweeper.done():
+            Telegram._sweeper = asyncio.create_task(Telegram._sweep_cache())
+
+    @staticmethod
+    async def _sweep_cache() -> None:
+        while True:
+            await asyncio.sleep(Telegram.CACHE_SWEEP_INTERVAL)
+            now = monotonic()
+            expired = [k for k, (exp, _) in Telegram.DownloaderCache.items() if exp < now]
+            for key in expired:
+                del Telegram.DownloaderCache[key]
 
 
 tg = Telegram()
@@ -2,11 +2,12 @@
 #  Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 
+import asyncio
 import os
 import random
 import re
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 from ntgcalls import TelegramServerError, ConnectionNotFound
 from pyrogram import Client as PyroClient
@@ -36,26 +37,138 @@ from ._cacher import (
     user_status_cache,
     chat_invite_cache,
 )
+from ._api import ApiData
 from ._database import db
 from ._dataclass import CachedTrack
-from ._downloader import DownloaderWrapper
+from ._downloader import DownloaderWrapper, MusicService
+from ._jiosaavn import JiosaavnData
+from ._youtube import YouTubeData
 from .buttons import control_buttons
 from .thumbnails import gen_thumb
 from .utils import send_logger
 
+_URL_RE = re.compile(r"https?://")
+
+# Assistant assignments are written to the database in batches
+ASSISTANT_FLUSH_INTERVAL = 0.5  # seconds
+ASSISTANT_FLUSH_THRESHOLD = 500
+# Chat cache cleanups from leave/kick updates are coalesced and drained periodically
+CLEAR_DRAIN_INTERVAL = 0.2  # seconds
+
+# (audio_parameters, video_parameters, video_flags) keyed by ``video``
+_STREAM_CFG = {
+    True: (AudioQuality.HIGH, VideoQuality.FHD_1080p, MediaStream.Flags.AUTO_DETECT),
+    False: (AudioQuality.STUDIO, VideoQuality.SD_360p, MediaStream.Flags.IGNORE),
+}
+
+# Build the handler for a known platform directly instead of probing every
+# service through DownloaderWrapper.
+_PLATFORM_FACTORIES: dict[str, Callable[[CachedTrack], MusicService]] = {
+    "youtube": lambda s: YouTubeData(s.url),
+    "jiosaavn": lambda s: JiosaavnData(s.url),
+    "spotify": lambda s: ApiData(s.url),
+    "apple_music": lambda s: ApiData(s.url),
+    "soundcloud": lambda s: ApiData(s.url),
+}
+
+_NO_VOICE_CHAT = (
+    404,
+    "No active voice chat found.\n\nPlease start a voice chat and try again.",
+)
+# Known pytgcalls/ntgcalls failures and the error they are reported as
+_ERR_MAP: dict[type[Exception], tuple[int, str]] = {
+    exceptions.NoActiveGroupCall: _NO_VOICE_CHAT,
+    ConnectionNotFound: _NO_VOICE_CHAT,
+    TelegramServerError: (
+        502,
+        "Telegram server issues detected. Please try again later.",
+    ),
+    exceptions.NoAudioSourceFound: (404, "Audio source not found."),
+}
+
+
+def _map_err(e: Exception) -> Optional[types.Error]:
+    """Translate a known call error into a types.Error, or None if unmapped."""
+    for exc_type, (code, message) in _ERR_MAP.items():
+        if isinstance(e, exc_type):
+            return types.Error(code=code, message=message)
+    return None
+
 
 class Calls:
+    __slots__ = (
+        "calls",
+        "pyrogram_clients",
+        "client_counter",
+        "available_clients",
+        "bot",
+        "_bot_id",
+        "_pending_assistant",
+        "_assistant_flush_task",
+        "_flush_tasks",
+        "_pending_clear",
+        "_clear_drain_task",
+    )
+
     def __init__(self):
         self.calls: dict[str, PyTgCalls] = {}
         self.pyrogram_clients: dict[str, PyroClient] = {}
         self.client_counter: int = 1
         self.available_clients: list[str] = []
         self.bot: Optional[Client] = None
+        self._bot_id: Optional[int] = None
+        self._pending_assistant: dict[int, str] = {}
+        self._assistant_flush_task: Optional[asyncio.Task] = None
+        # Strong references to threshold-triggered flushes until they finish
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._pending_clear: set[int] = set()
+        self._clear_drain_task: Optional[asyncio.Task] = None
 
     async def add_bot(self, bot: Client) -> types.Ok:
         self.bot = bot
+        # ``me`` is only populated once the bot has started; resolved lazily otherwise
+        me = getattr(bot, "me", None)
+        self._bot_id = me.id if me else None
+        if self._assistant_flush_task is None or self._assistant_flush_task.done():
+            self._assistant_flush_task = asyncio.create_task(
+                self._assistant_flush_loop()
+            )
+        if self._clear_drain_task is None or self._clear_drain_task.done():
+            self._clear_drain_task = asyncio.create_task(self._drain_clears())
         return types.Ok()
 
+    def _get_bot_id(self) -> int:
+        if self._bot_id is None:
+            self._bot_id = self.bot.me.id
+        return self._bot_id
+
+    async def _assistant_flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(ASSISTANT_FLUSH_INTERVAL)
+            await self.flush_assistants()
+
+    async def _drain_clears(self) -> None:
+        while True:
+            await asyncio.sleep(CLEAR_DRAIN_INTERVAL)
+            if not self._pending_clear:
+                continue
+            pending, self._pending_clear = self._pending_clear, set()
+            for chat_id in pending:
+                chat_cache.clear_chat(chat_id)
+
+    async def flush_assistants(self) -> None:
+        """Write pending assistant assignments to the database in one batch."""
+        if not self._pending_assistant:
+            return
+
+        pending, self._pending_assistant = self._pending_assistant, {}
+        try:
+            await db.bulk_set_assistant(pending)
+        except Exception as e:
+            LOGGER.error("Failed to save assistants for %d chats: %s", len(pending), e)
+            # Retry on the next flush; newer assignments take precedence
+            self._pending_assistant = pending | self._pending_assistant
+
     async def _get_client_name(self, chat_id: int) -> Union[str, types.Error]:
         """Get an available client session for a chat."""
         if not self.available_clients:
@@ -63,15 +176,22 @@ class Calls:
                 code=500, message="No clients available\nReport this issue"
             )
 
-        if chat_id == 1:
+        # Test-only shortcut; compiled out under ``python -O``
+        if __debug__ and chat_id == 1:
             return random.choice(self.available_clients)
 
-        assistant = await db.get_assistant(chat_id)
+        assistant = self._pending_assistant.get(chat_id) or await db.get_assistant(
+            chat_id
+        )
         if assistant and assistant in self.available_clients:
             return assistant
 
         new_client = random.choice(self.available_clients)
-        await db.set_assistant(chat_id, assistant=new_client)
+        self._pending_assistant[chat_id] = new_client
+        if len(self._pending_assistant) >= ASSISTANT_FLUSH_THRESHOLD:
+            task = asyncio.create_task(self.flush_assistants())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
         LOGGER.info("Set assistant for %s to %s", chat_id, new_client)
         return new_client
 
@@ -137,6 +257,11 @@ class Calls:
             LOGGER.info("Client %s started successfully", client_name)
         except Exception as e:
             LOGGER.error("Error starting client %s: %s", client_name, e)
+            # Keep a failed session out of assistant selection
+            self.calls.pop(client_name, None)
+            self.pyrogram_clients.pop(client_name, None)
+            if client_name in self.available_clients:
+                self.available_clients.remove(client_name)
             raise RuntimeError(f"Failed to start client {client_name}: {str(e)}") from e
 
     async def stop_all_clients(self) -> None:
@@ -162,26 +287,28 @@ class Calls:
                 LOGGER.error("Error checking health of client %s: %s", name, e)
                 raise RuntimeError(f"Failed to check health of client {name}: {str(e)}") from e
 
+    async def _on_update(self, _, update: Update) -> None:
+        """Shared pytgcalls update handler for every assistant client."""
+        # Ordered by frequency: participant updates dominate in busy calls.
+        update_type = type(update)
+        if update_type is UpdatedGroupCallParticipant:
+            return
+        try:
+            if update_type is stream.StreamEnded:
+                await self.play_next(update.chat_id)
+                return
+            if update_type is ChatUpdate:
+                status = update.status
+                if status.KICKED or status.LEFT_GROUP:
+                    LOGGER.debug("Cleaning up chat %s after leaving", update.chat_id)
+                    self._pending_clear.add(update.chat_id)
+        except Exception as e:
+            LOGGER.error("Error in general handler: %s", e, exc_info=True)
+
     async def register_decorators(self) -> None:
         """Register pytgcalls event handlers."""
         for _call in self.calls.values():
-
-            @_call.on_update()
-            async def general_handler(_, update: Update, _call=_call):
-                try:
-                    if isinstance(update, stream.StreamEnded):
-                        await self.play_next(update.chat_id)
-                    elif isinstance(update, UpdatedGroupCallParticipant):
-                        return
-                    elif isinstance(update, ChatUpdate) and (
-                        update.status.KICKED or update.status.LEFT_GROUP
-                    ):
-                        LOGGER.debug(
-                            "Cleaning up chat %s after leaving", update.chat_id
-                        )
-                        chat_cache.clear_chat(update.chat_id)
-                except Exception as e:
-                    LOGGER.error("Error in general handler: %s", e, exc_info=True)
+            _call.on_update()(self._on_update)
 
     async def play_media(
         self,
@@ -189,6 +316,7 @@ class Calls:
         file_path: Union[str, Path],
         video: bool = False,
         ffmpeg_parameters: Optional[str] = None,
+        logger_on: Optional[bool] = None,
     ) -> Union[types.Ok, types.Error]:
         """Play media in a voice chat.
 
@@ -197,6 +325,7 @@ class Calls:
             file_path: Path to media file
             video: Whether to stream video
             ffmpeg_parameters: Custom ffmpeg parameters
+            logger_on: Pre-fetched logger status; queried from the database if None
 
         Returns:
             types.Ok on success or types.Error on failure
@@ -211,7 +340,12 @@ class Calls:
             return client
 
         # Validate media file exists if not URL
-        if not re.match("^https?://", str(file_path)) and not os.path.exists(file_path):
+        if isinstance(file_path, str):
+            is_url = file_path[:7] == "http://" or file_path[:8] == "https://"
+            missing = not is_url and not os.path.exists(file_path)
+        else:
+            missing = not file_path.exists()
+        if missing:
             return types.Error(
                 code=404, message="Media file not found. It may have been deleted."
             )
@@ -221,15 +355,14 @@ class Calls:
             chat_cache.clear_chat(chat_id)
             return join
 
+        audio_params, video_params, video_flags = _STREAM_CFG[bool(video)]
         _stream = MediaStream(
             audio_path=file_path,
             media_path=file_path,
-            audio_parameters=AudioQuality.HIGH if video else AudioQuality.STUDIO,
-            video_parameters=VideoQuality.FHD_1080p if video else VideoQuality.SD_360p,
+            audio_parameters=audio_params,
+            video_parameters=video_params,
             audio_flags=MediaStream.Flags.REQUIRED,
-            video_flags=(
-                MediaStream.Flags.AUTO_DETECT if video else MediaStream.Flags.IGNORE
-            ),
+            video_flags=video_flags,
             ffmpeg_parameters=ffmpeg_parameters,
         )
 
@@ -239,7 +372,9 @@ class Calls:
         try:
             await client.play(chat_id, _stream, call_config)
             # Send playback log if enabled
-            if await db.get_logger_status(self.bot.me.id):
+            if logger_on is None:
+                logger_on = await db.get_logger_status(self._get_bot_id())
+            if logger_on:
                 self.bot.loop.create_task(
                     send_logger(
                         self.bot, chat_id, chat_cache.get_playing_track(chat_id)
@@ -247,25 +382,15 @@ class Calls:
                 )
 
             return types.Ok()
-        except (exceptions.NoActiveGroupCall, ConnectionNotFound):
-            return types.Error(
-                code=404,
-                message="No active voice chat found.\n\n"
-                "Please start a voice chat and try again.",
-            )
-        except TelegramServerError:
-            LOGGER.warning("Telegram server error during playback")
-            return types.Error(
-                code=502,
-                message="Telegram server issues detected. Please try again later.",
-            )
-        except exceptions.NoAudioSourceFound as e:
-            LOGGER.error("Audio source not found in chat %s: %s", chat_id, str(e))
-            return types.Error(code=404, message="Audio source not found.")
-        except errors.RPCError as e:
-            LOGGER.error("Playback failed in chat %s: %s", chat_id, str(e))
-            return types.Error(code=e.CODE or 500, message=f"Playback error: {str(e)}")
         except Exception as e:
+            if err := _map_err(e):
+                LOGGER.warning("Playback failed in chat %s: %r", chat_id, e)
+                return err
+            if isinstance(e, errors.RPCError):
+                LOGGER.error("Playback failed in chat %s: %s", chat_id, str(e))
+                return types.Error(
+                    code=e.CODE or 500, message=f"Playback error: {str(e)}"
+                )
             LOGGER.error(
                 "Playback failed in chat %s: %s", chat_id, str(e), exc_info=True
             )
@@ -307,9 +432,12 @@ class Calls:
         LOGGER.info("Playing song for chat %s: %s", chat_id, song.name)
 
         try:
-            # Send an initial loading message
-            reply = await self.bot.sendTextMessage(
-                chat_id, "⏳ Loading... Please wait."
+            # Send an initial loading message while fetching chat/bot settings
+            reply, thumb_on, buttons_on, logger_on = await asyncio.gather(
+                self.bot.sendTextMessage(chat_id, "⏳ Loading... Please wait."),
+                db.get_thumbnail_status(chat_id),
+                db.get_buttons_status(chat_id),
+                db.get_logger_status(self._get_bot_id()),
             )
             if isinstance(reply, types.Error):
                 LOGGER.error("Failed to send message: %s", reply)
@@ -324,14 +452,27 @@ class Calls:
                 await self.play_next(chat_id)
                 return
 
+            # Probe duration and render the thumbnail while playback starts
+            duration_task = (
+                None
+                if song.duration
+                else asyncio.create_task(get_audio_duration(file_path))
+            )
+            thumb_task = asyncio.create_task(gen_thumb(song)) if thumb_on else None
+
             # Start playback
-            play_result = await self.play_media(chat_id, file_path, video=song.is_video)
+            play_result = await self.play_media(
+                chat_id, file_path, video=song.is_video, logger_on=logger_on
+            )
             if isinstance(play_result, types.Error):
+                for task in (duration_task, thumb_task):
+                    if task:
+                        task.cancel()
                 await reply.edit_text(play_result.message)
                 return
 
             # Get duration if not available
-            duration = song.duration or await get_audio_duration(file_path)
+            duration = song.duration or await duration_task
 
             # Prepare a playback message
             text = (
@@ -341,11 +482,13 @@ class Calls:
                 f"‣ <b>Requested by:</b> {song.user}"
             )
 
-            thumbnail = (
-                await gen_thumb(song) if await db.get_thumbnail_status(chat_id) else ""
-            )
-            # Parse text entities
-            parse = await self.bot.parseTextEntities(text, types.TextParseModeHTML())
+            reply_markup = control_buttons("play") if buttons_on else None
+            # Parse text entities alongside the pending thumbnail
+            parse = self.bot.parseTextEntities(text, types.TextParseModeHTML())
+            if thumb_task:
+                parse, thumbnail = await asyncio.gather(parse, thumb_task)
+            else:
+                parse, thumbnail = await parse, ""
             if isinstance(parse, types.Error):
                 LOGGER.error("Failed to parse text entities: %s", parse)
                 parse = text  # Fallback to an original text
@@ -359,11 +502,7 @@ class Calls:
                     chat_id=chat_id,
                     message_id=reply.id,
                     input_message_content=input_content,
-                    reply_markup=(
-                        control_buttons("play")
-                        if await db.get_buttons_status(chat_id)
-                        else None
-                    ),
+                    reply_markup=reply_markup,
                 )
             else:
                 await self.bot.editMessageText(
@@ -373,11 +512,7 @@ class Calls:
                         text=parse,
                         link_preview_options=types.LinkPreviewOptions(is_disabled=True),
                     ),
-                    reply_markup=(
-                        control_buttons("play")
-                        if await db.get_buttons_status(chat_id)
-                        else None
-                    ),
+                    reply_markup=reply_markup,
                 )
 
         except Exception as e:
@@ -396,13 +531,14 @@ class Calls:
             Path to the downloaded file or types.Error if download fails
         """
         song_url = song.url
-        wrapper = DownloaderWrapper(song_url)
-        if wrapper.is_valid():
-            track_info = await wrapper.get_track()
+        factory = _PLATFORM_FACTORIES.get(song.platform.lower())
+        service = factory(song) if factory else DownloaderWrapper(song_url)
+        if service.is_valid():
+            track_info = await service.get_track()
             if isinstance(track_info, types.Error):
                 return track_info
 
-            return await wrapper.download_track(track_info, song.is_video)
+            return await service.download_track(track_info, song.is_video)
         return types.Error(
             code=400,
             message=f"Invalid URL: {song_url}",
@@ -481,7 +617,7 @@ class Calls:
             )
 
         try:
-            is_url = bool(re.match(r"https?://", str(file_path_or_url)))
+            is_url = bool(_URL_RE.match(str(file_path_or_url)))
             ffmpeg_params = (
                 f"-ss {to_seek} -i {file_path_or_url} -to {duration}"
                 if is_url or not os.path.isfile(file_path_or_url)
@@ -516,12 +652,18 @@ class Calls:
         if not curr_song or not curr_song.file_path:
             return types.Error(code=404, message="No track currently playing")
 
+        # Resume from the current position instead of restarting the track
+        position = await self.played_time(chat_id)
+        if isinstance(position, types.Error):
+            position = 0
+
         return await self.play_media(
             chat_id,
             curr_song.file_path,
             curr_song.is_video,
             ffmpeg_parameters=(
-                f"-atend -filter:v setpts=0.5*PTS " f"-filter:a atempo={speed}"
+                f"-ss {position} -atend -filter:v setpts={1 / speed}*PTS "
+                f"-filter:a atempo={speed}"
             ),
         )
 
@@ -538,14 +680,16 @@ class Calls:
             None on success or types.Error on failure
         """
         try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
+            client_name = await self._get_client_name(chat_id)
+            if isinstance(client_name, types.Error):
+                return client_name
+
+            pytg = self.calls[client_name]
 
             if volume < 1 or volume > 200:
                 return types.Error(code=400, message="Volume must be between 1 and 200")
 
-            await client.change_volume_call(chat_id, volume)
+            await pytg.change_volume_call(chat_id, volume)
             return None
         except Exception as e:
             LOGGER.error(
@@ -553,27 +697,44 @@ class Calls:
             )
             return types.Error(code=500, message=f"Volume change failed: {str(e)}")
 
-    async def mute(self, chat_id: int) -> Union[types.Ok, types.Error]:
-        """Mute the current stream.
+    async def _simple_call(
+        self, chat_id: int, method: str, label: str
+    ) -> Union[types.Ok, types.Error]:
+        """Invoke a result-less PyTgCalls method on the chat's assistant.
 
         Args:
             chat_id: Target chat ID
+            method: Name of the PyTgCalls method to call
+            label: Operation name used in logs and error messages
 
         Returns:
             types.Ok on success or types.Error on failure
         """
         try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
+            client_name = await self._get_client_name(chat_id)
+            if isinstance(client_name, types.Error):
+                return client_name
 
-            await client.mute(chat_id)
+            await getattr(self.calls[client_name], method)(chat_id)
             return types.Ok()
         except (exceptions.NotInCallError, ConnectionNotFound):
             return types.Error(code=400, message="My Assistant is not in a call")
         except Exception as e:
-            LOGGER.error("Mute failed for chat %s: %s", chat_id, str(e), exc_info=True)
-            return types.Error(code=500, message=f"Mute operation failed: {str(e)}")
+            LOGGER.error(
+                "%s failed for chat %s: %s", label, chat_id, str(e), exc_info=True
+            )
+            return types.Error(code=500, message=f"{label} operation failed: {str(e)}")
+
+    async def mute(self, chat_id: int) -> Union[types.Ok, types.Error]:
+        """Mute the current stream.
+
+        Args:
+            chat_id: Target chat ID
+
+        Returns:
+            types.Ok on success or types.Error on failure
+        """
+        return await self._simple_call(chat_id, "mute", "Mute")
 
     async def unmute(self, chat_id: int) -> Union[types.Ok, types.Error]:
         """Unmute the current stream.
@@ -584,20 +745,7 @@ class Calls:
         Returns:
             types.Ok on success or types.Error on failure
         """
-        try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
-
-            await client.unmute(chat_id)
-            return types.Ok()
-        except (exceptions.NotInCallError, ConnectionNotFound):
-            return types.Error(code=400, message="My Assistant is not in a call")
-        except Exception as e:
-            LOGGER.error(
-                "Unmute failed for chat %s: %s", chat_id, str(e), exc_info=True
-            )
-            return types.Error(code=500, message=f"Unmute operation failed: {str(e)}")
+        return await self._simple_call(chat_id, "unmute", "Unmute")
 
     async def resume(self, chat_id: int) -> Union[types.Ok, types.Error]:
         """Resume a paused stream.
@@ -608,20 +756,7 @@ class Calls:
         Returns:
             types.Ok on success or types.Error on failure
         """
-        try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
-
-            await client.resume(chat_id)
-            return types.Ok()
-        except (exceptions.NotInCallError, ConnectionNotFound):
-            return types.Error(code=400, message="My Assistant is not in a call")
-        except Exception as e:
-            LOGGER.error(
-                "Resume failed for chat %s: %s", chat_id, str(e), exc_info=True
-            )
-            return types.Error(code=500, message=f"Resume operation failed: {str(e)}")
+        return await self._simple_call(chat_id, "resume", "Resume")
 
     async def pause(self, chat_id: int) -> Union[types.Ok, types.Error]:
         """Pause the current stream.
@@ -632,16 +767,7 @@ class Calls:
         Returns:
             types.Ok on success or types.Error on failure
         """
-        try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
-
-            await client.pause(chat_id)
-            return types.Ok()
-        except Exception as e:
-            LOGGER.error("Pause failed for chat %s: %s", chat_id, str(e), exc_info=True)
-            return types.Error(code=500, message=f"Pause operation failed: {str(e)}")
+        return await self._simple_call(chat_id, "pause", "Pause")
 
     async def played_time(self, chat_id: int) -> Union[int, types.Error]:
         """Get the current playback position.
@@ -653,11 +779,13 @@ class Calls:
             Current position in seconds or types.Error on failure
         """
         try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
+            client_name = await self._get_client_name(chat_id)
+            if isinstance(client_name, types.Error):
+                return client_name
+
+            pytg = self.calls[client_name]
 
-            return await client.time(chat_id)
+            return await pytg.time(chat_id)
         except exceptions.NotInCallError:
             chat_cache.clear_chat(chat_id)
             return 0
@@ -679,11 +807,13 @@ class Calls:
             List of participants or types.Error on failure
         """
         try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
+            client_name = await self._get_client_name(chat_id)
+            if isinstance(client_name, types.Error):
+                return client_name
 
-            return await client.get_participants(chat_id)
+            pytg = self.calls[client_name]
+
+            return await pytg.get_participants(chat_id)
         except exceptions.UnsupportedMethod:
             return types.Error(
                 code=501, message="This method is not supported by the server"
@@ -709,13 +839,15 @@ class Calls:
             Tuple of (ping, cpu_usage) or types.Error on failure
         """
         try:
-            client = await self._group_assistant(chat_id)
-            if isinstance(client, types.Error):
-                return client
+            client_name = await self._get_client_name(chat_id)
+            if isinstance(client_name, types.Error):
+                return client_name
+
+            pytg = self.calls[client_name]
 
             return (
-                client.ping,
-                await client.cpu_usage,
+                pytg.ping,
+                await pytg.cpu_usage,
             )
         except Exception as e:
             LOGGER.error(
@@ -3,12 +3,16 @@
 # Part of the TgMusicBot project. All rights reserved where applicable.
 
 import asyncio
+import functools
 import os
 import random
 import re
+import time
 from pathlib import Path
 from typing import Any, Optional, Dict, Union
 
+import yt_dlp
+from cachetools import TTLCache
 from py_yt import Playlist, VideosSearch
 from pytdbot import types
 
@@ -20,126 +24,184 @@ from ._dataclass import MusicTrack, PlatformTracks, TrackInfo
 from ._downloader import MusicService
 from ._httpx import HttpxClient
 
+# Video id -> formatted (id, title, duration, cover); popular videos recur across
+# searches and playlists
+_TRACK_FIELDS_CACHE = TTLCache(maxsize=4096, ttl=3600)
+
+# (query, limit) -> VideosSearch result; popular queries repeat within minutes
+_SEARCH_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+# (cookie file paths, monotonic time they were listed)
+COOKIES_REFRESH_INTERVAL = 60  # seconds
+_COOKIES_CACHE: tuple[list[str], float] = ([], float("-inf"))
+
 
 class YouTubeUtils:
     """Utility class for YouTube-related operations."""
 
-    # Compile regex patterns once at class level
+    # Compile regex patterns once at class level. They are only used with
+    # ``match()``, which already anchors at the start of the string.
     YOUTUBE_VIDEO_PATTERN = re.compile(
-        r"^(?:https?://)?(?:www\.)?(?:youtube\.com|music\.youtube\.com|youtu\.be)/"
+        r"(?:https?://)?(?:www\.)?(?:youtube\.com|music\.youtube\.com|youtu\.be)/"
         r"(?:watch\?v=|embed/|v/|shorts/)?([\w-]{11})(?:\?|&|$)",
         re.IGNORECASE,
     )
     YOUTUBE_PLAYLIST_PATTERN = re.compile(
-        r"^(?:https?://)?(?:www\.)?(?:youtube\.com|music\.youtube\.com)/"
+        r"(?:https?://)?(?:www\.)?(?:youtube\.com|music\.youtube\.com)/"
         r"(?:playlist|watch)\?.*\blist=([\w-]+)",
         re.IGNORECASE,
     )
     YOUTUBE_SHORTS_PATTERN = re.compile(
-        r"^(?:https?://)?(?:www\.)?youtube\.com/shorts/([\w-]+)",
+        r"(?:https?://)?(?:www\.)?youtube\.com/shorts/([\w-]+)",
+        re.IGNORECASE,
+    )
+    NORMALIZE_PATTERN = re.compile(
+        r"(?:youtu\.be/|youtube\.com/shorts/|youtube\.com/watch\?v=|youtube\.com/embed/)"
+        r"([\w-]{11})"
+    )
+    # The three patterns above as one alternation, so validation is a single
+    # match; each branch is a named group, so ``lastgroup`` reports the URL kind
+    # and the branch's own ID group follows it at ``lastindex + 1``
+    YOUTUBE_COMBINED_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{kind}>{pattern.pattern})"
+            for kind, pattern in (
+                ("video", YOUTUBE_VIDEO_PATTERN),
+                ("shorts", YOUTUBE_SHORTS_PATTERN),
+                ("playlist", YOUTUBE_PLAYLIST_PATTERN),
+            )
+        ),
         re.IGNORECASE,
     )
 
+    # One pooled client for oEmbed and API calls instead of a new one per request
+    _http: Optional[HttpxClient] = None
+
+    @staticmethod
+    def _get_http() -> HttpxClient:
+        if YouTubeUtils._http is None:
+            YouTubeUtils._http = HttpxClient()
+        return YouTubeUtils._http
+
     @staticmethod
     def clean_query(query: str) -> str:
         """Clean the query by removing unnecessary parameters."""
         return query.split("&")[0].split("#")[0].strip()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def classify_url(url: str) -> Optional[str]:
+        """Return "video", "shorts" or "playlist" for a YouTube URL, else None."""
+        if match := YouTubeUtils.YOUTUBE_COMBINED_PATTERN.match(url):
+            return match.lastgroup
+        return None
+
     @staticmethod
     def is_valid_url(url: Optional[str]) -> bool:
-        if not url:
+        # Every supported URL contains "youtu"; reject search queries without regex work
+        if not url or "youtu" not in url.lower():
             return False
-        return any(
-            pattern.match(url)
-            for pattern in (
-                YouTubeUtils.YOUTUBE_VIDEO_PATTERN,
-                YouTubeUtils.YOUTUBE_PLAYLIST_PATTERN,
-                YouTubeUtils.YOUTUBE_SHORTS_PATTERN,
-            )
-        )
+        return YouTubeUtils.classify_url(url) is not None
 
     @staticmethod
     def _extract_video_id(url: str) -> Optional[str]:
         """Extract video ID from various YouTube URL formats."""
-        for pattern in (
-            YouTubeUtils.YOUTUBE_VIDEO_PATTERN,
-            YouTubeUtils.YOUTUBE_SHORTS_PATTERN,
-        ):
-            if match := pattern.match(url):
-                return match.group(1)
+        match = YouTubeUtils.YOUTUBE_COMBINED_PATTERN.match(url)
+        if match and match.lastgroup != "playlist":
+            return match.group(match.lastindex + 1)
         return None
 
     @staticmethod
-    async def normalize_youtube_url(url: str) -> Optional[str]:
+    def normalize_youtube_url(url: str) -> Optional[str]:
         """Normalize different YouTube URL formats to standard watch URL."""
         if not url:
             return None
 
-        # Handle youtu.be short links
-        if "youtu.be/" in url:
-            video_id = url.split("youtu.be/")[1].partition("?")[0].partition("#")[0]
-            return f"https://www.youtube.com/watch?v={video_id}"
-
-        # Handle YouTube shorts
-        if "youtube.com/shorts/" in url:
-            video_id = url.split("youtube.com/shorts/")[1].split("?")[0]
-            return f"https://www.youtube.com/watch?v={video_id}"
+        # Handle youtu.be, shorts, watch and embed links in one search
+        if match := YouTubeUtils.NORMALIZE_PATTERN.search(url):
+            return f"https://www.youtube.com/watch?v={match.group(1)}"
 
         return url
 
+    @staticmethod
+    async def cached_search(query: str, limit: int) -> Optional[dict[str, Any]]:
+        """Run a VideosSearch, reusing recent results for the same query."""
+        key = (query, limit)
+        if (results := _SEARCH_CACHE.get(key)) is not None:
+            return results
+
+        results = await VideosSearch(query, limit=limit).next()
+        if results and results.get("result"):
+            _SEARCH_CACHE[key] = results
+        return results
+
     @staticmethod
     def create_platform_tracks(data: Dict[str, Any]) -> PlatformTracks:
         """Create PlatformTracks object from data."""
         if not data or not data.get("results"):
             return PlatformTracks(tracks=[])
 
-        valid_tracks = [
-            MusicTrack(**track)
-            for track in data["results"]
-            if track and track.get("id")
-        ]
+        valid_tracks = [track for track in data["results"] if track and track.id]
         return PlatformTracks(tracks=valid_tracks)
 
     @staticmethod
-    def format_track(track_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Format track data into a consistent structure."""
+    def _extract_track_fields(track_data: Dict[str, Any]) -> tuple[str, str, int, str]:
+        """Return (id, title, duration in seconds, cover url) from raw track data."""
+        track_id = track_data.get("id", "")
+        if track_id and (cached := _TRACK_FIELDS_CACHE.get(track_id)):
+            return cached
+
         duration = track_data.get("duration", "0:00")
         if isinstance(duration, dict):
             duration = duration.get("secondsText", "0:00")
 
-        # Get the highest quality thumbnail
+        # Get the highest quality thumbnail (YouTube sorts them ascending)
         cover_url = ""
-        if thumbnails := track_data.get("thumbnails"):
-            for thumb in reversed(thumbnails):
-                if url := thumb.get("url"):
-                    cover_url = url
-                    break
-
-        return {
-            "id": track_data.get("id", ""),
-            "name": track_data.get("title", "Unknown Title"),
-            "duration": YouTubeUtils.duration_to_seconds(duration),
-            "cover": cover_url,
-            "year": 0,
-            "url": f"https://www.youtube.com/watch?v={track_data.get('id', '')}",
-            "platform": "youtube",
-        }
+        thumbnails = track_data.get("thumbnails") or ()
+        for i in range(len(thumbnails) - 1, -1, -1):
+            if url := thumbnails[i].get("url"):
+                cover_url = url
+                break
+
+        fields = (
+            track_id,
+            track_data.get("title", "Unknown Title"),
+            YouTubeUtils.duration_to_seconds(duration),
+            cover_url,
+        )
+        if track_id:
+            _TRACK_FIELDS_CACHE[track_id] = fields
+        return fields
+
+    @staticmethod
+    def format_music_track(track_data: Dict[str, Any]) -> MusicTrack:
+        """Build a MusicTrack directly from raw search/playlist data."""
+        track_id, name, duration, cover = YouTubeUtils._extract_track_fields(track_data)
+        return MusicTrack(
+            id=track_id,
+            name=name,
+            duration=duration,
+            cover=cover,
+            url=f"https://www.youtube.com/watch?v={track_id}",
+            platform="youtube",
+        )
 
     @staticmethod
-    async def create_track_info(track_data: dict[str, Any]) -> TrackInfo:
-        """Create TrackInfo from formatted track data."""
+    def create_track_info(track: MusicTrack) -> TrackInfo:
+        """Create TrackInfo from a formatted track."""
         return TrackInfo(
             cdnurl="None",
             key="None",
-            name=track_data.get("name", "Unknown Title"),
-            tc=track_data.get("id", ""),
-            cover=track_data.get("cover", ""),
-            duration=track_data.get("duration", 0),
+            name=track.name,
+            tc=track.id,
+            cover=track.cover,
+            duration=track.duration,
             platform="youtube",
-            url=f"https://youtube.com/watch?v={track_data.get('id', '')}",
+            url=f"https://youtube.com/watch?v={track.id}",
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def duration_to_seconds(duration: str) -> int:
         """
         Convert duration string (HH:MM:SS or MM:SS) to seconds.
@@ -150,57 +212,67 @@ class YouTubeUtils:
         Returns:
             int: Duration in seconds
         """
-        if not duration:
+        if not duration or not isinstance(duration, str):
             return 0
 
-        try:
-            parts = list(map(int, duration.split(":")))
-            if len(parts) == 3:  # HH:MM:SS
-                return parts[0] * 3600 + parts[1] * 60 + parts[2]
-            return parts[0] * 60 + parts[1] if len(parts) == 2 else parts[0]
-        except (ValueError, AttributeError):
-            return 0
+        # Single right-to-left pass; no intermediate lists
+        total, mult, cur, place = 0, 1, 0, 1
+        for ch in reversed(duration):
+            if ch == ":":
+                total += cur * mult
+                mult *= 60
+                cur, place = 0, 1
+            elif "0" <= ch <= "9":
+                cur += (ord(ch) - 48) * place
+                place *= 10
+            else:
+                return 0
+        return total + cur * mult
 
     @staticmethod
-    async def get_cookie_file() -> Optional[str]:
+    def get_cookie_file() -> Optional[str]:
         """Get a random cookie file from the 'cookies' directory."""
         cookie_dir = "TgMusic/cookies"
-        try:
-            if not os.path.exists(cookie_dir):
-                LOGGER.warning("Cookie directory '%s' does not exist.", cookie_dir)
-                return None
-
-            files = await asyncio.to_thread(os.listdir, cookie_dir)
-            cookies_files = [f for f in files if f.endswith(".txt")]
-
-            if not cookies_files:
-                LOGGER.warning("No cookie files found in '%s'.", cookie_dir)
-                return None
-
-            random_file = random.choice(cookies_files)
-            return os.path.join(cookie_dir, random_file)
-        except Exception as e:
-            LOGGER.warning("Error accessing cookie directory: %s", e)
-            return None
+        global _COOKIES_CACHE
+        files, listed_at = _COOKIES_CACHE
+        now = time.monotonic()
+        # Re-list the directory at most once per interval instead of per download
+        if now - listed_at > COOKIES_REFRESH_INTERVAL:
+            try:
+                if not os.path.exists(cookie_dir):
+                    LOGGER.warning("Cookie directory '%s' does not exist.", cookie_dir)
+                    files = []
+                else:
+                    files = [
+                        os.path.join(cookie_dir, f)
+                        for f in os.listdir(cookie_dir)
+                        if f.endswith(".txt")
+                    ]
+                    if not files:
+                        LOGGER.warning("No cookie files found in '%s'.", cookie_dir)
+            except Exception as e:
+                LOGGER.warning("Error accessing cookie directory: %s", e)
+                files = []
+            _COOKIES_CACHE = (files, now)
+
+        return random.choice(files) if files else None
 
     @staticmethod
     async def fetch_oembed_data(url: str) -> Optional[dict[str, Any]]:
         oembed_url = f"https://www.youtube.com/oembed?url={url}&format=json"
-        data = await HttpxClient().make_request(oembed_url, max_retries=1)
+        data = await YouTubeUtils._get_http().make_request(oembed_url, max_retries=1)
         if data:
             video_id = url.split("v=")[1]
             return {
                 "results": [
-                    {
-                        "id": video_id,
-                        "name": data.get("title"),
-                        "duration": 0,
-                        "artist": data.get("author_name", ""),
-                        "cover": data.get("thumbnail_url", ""),
-                        "year": 0,
-                        "url": f"https://www.youtube.com/watch?v={video_id}",
-                        "platform": "youtube",
-                    }
+                    MusicTrack(
+                        id=video_id,
+                        name=data.get("title", "Unknown Title"),
+                        duration=0,
+                        cover=data.get("thumbnail_url", ""),
+                        url=f"https://www.youtube.com/watch?v={video_id}",
+                        platform="youtube",
+                    )
                 ]
             }
         return None
@@ -213,7 +285,7 @@ class YouTubeUtils:
         Download audio using the API.
         """
         video_url = f"https://www.youtube.com/watch?v={video_id}"
-        httpx = HttpxClient()
+        httpx = YouTubeUtils._get_http()
         get_track = await httpx.make_request(f"{config.API_URL}/track?url={video_url}&video={is_video}")
         if not get_track:
             LOGGER.error("Response from API is empty")
@@ -254,63 +326,61 @@ class YouTubeUtils:
 
 
     @staticmethod
-    def _build_ytdlp_params(
-        video_id: str, video: bool, cookie_file: Optional[str]
-    ) -> list[str]:
-        """Construct yt-dlp parameters based on video/audio requirements."""
-        output_template = str(config.DOWNLOADS_DIR / "%(id)s.%(ext)s")
-
+    def _build_ytdlp_opts(video: bool, cookie_file: Optional[str]) -> dict[str, Any]:
+        """Construct yt-dlp options based on video/audio requirements."""
         format_selector = (
             "bestvideo[ext=mp4][height<=1080]+bestaudio[ext=m4a]/best[ext=mp4][height<=1080]"
             if video
             else "bestaudio[ext=m4a]/bestaudio[ext=mp4]/bestaudio[ext=webm]/bestaudio/best"
         )
 
-        ytdlp_params = [
-            "yt-dlp",
-            "--no-warnings",
-            "--quiet",
-            "--geo-bypass",
-            "--retries",
-            "2",
-            "--continue",
-            "--no-part",
-            "--concurrent-fragments",
-            "3",
-            "--socket-timeout",
-            "10",
-            "--throttled-rate",
-            "100K",
-            "--retry-sleep",
-            "1",
-            "--no-write-thumbnail",
-            "--no-write-info-json",
-            "--no-embed-metadata",
-            "--no-embed-chapters",
-            "--no-embed-subs",
-            "-o",
-            output_template,
-            "-f",
-            format_selector,
-        ]
+        ytdlp_opts: dict[str, Any] = {
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+            "geo_bypass": True,
+            "retries": 2,
+            "continuedl": True,
+            "nopart": True,
+            "concurrent_fragment_downloads": 3,
+            "socket_timeout": 10,
+            "throttledratelimit": 100 * 1024,
+            "retry_sleep_functions": {"http": lambda _: 1},
+            "writethumbnail": False,
+            "writeinfojson": False,
+            "outtmpl": str(config.DOWNLOADS_DIR / "%(id)s.%(ext)s"),
+            "format": format_selector,
+        }
 
         if video:
-            ytdlp_params += ["--merge-output-format", "mp4"]
+            ytdlp_opts["merge_output_format"] = "mp4"
 
         if config.PROXY:
-            ytdlp_params += ["--proxy", config.PROXY]
+            ytdlp_opts["proxy"] = config.PROXY
         elif cookie_file:
-            ytdlp_params += ["--cookies", cookie_file]
+            ytdlp_opts["cookiefile"] = cookie_file
 
-        video_url = f"https://www.youtube.com/watch?v={video_id}"
-        ytdlp_params += [video_url, "--print", "after_move:filepath"]
+        return ytdlp_opts
 
-        return ytdlp_params
+    @staticmethod
+    def _run_yt_dlp(video_url: str, ytdlp_opts: dict[str, Any]) -> Optional[str]:
+        """Blocking yt-dlp download; returns the final file path."""
+        with yt_dlp.YoutubeDL(ytdlp_opts) as ydl:
+            info = ydl.extract_info(video_url, download=True)
+            if not info:
+                return None
+            # Same as ``--print after_move:filepath``
+            if downloads := info.get("requested_downloads"):
+                return downloads[0].get("filepath")
+            return ydl.prepare_filename(info)
 
     @staticmethod
     async def download_with_yt_dlp(video_id: str, video: bool) -> Optional[Path]:
         """Download YouTube media using yt-dlp.
 
+        Runs yt-dlp in-process on a worker thread instead of spawning a new
+        interpreter per download.
+
         Args:
             video_id (str): YouTube video ID.
             video (bool): True to download video; False for audio only.
@@ -318,30 +388,18 @@ class YouTubeUtils:
         Returns:
             Optional[str]: File path of the downloaded media, or None on failure.
         """
-        cookie_file = await YouTubeUtils.get_cookie_file()
-        ytdlp_params = YouTubeUtils._build_ytdlp_params(video_id, video, cookie_file)
+        cookie_file = YouTubeUtils.get_cookie_file()
+        ytdlp_opts = YouTubeUtils._build_ytdlp_opts(video, cookie_file)
+        video_url = f"https://www.youtube.com/watch?v={video_id}"
 
         try:
             LOGGER.debug("Starting yt-dlp download for video ID: %s", video_id)
 
-            proc = await asyncio.create_subprocess_exec(
-                *ytdlp_params,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            downloaded_path_str = await asyncio.wait_for(
+                asyncio.to_thread(YouTubeUtils._run_yt_dlp, video_url, ytdlp_opts),
+                timeout=600,
             )
 
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=600)
-
-            if proc.returncode != 0:
-                LOGGER.error(
-                    "yt-dlp failed for %s (code %d): %s",
-                    video_id,
-                    proc.returncode,
-                    stderr.decode().strip(),
-                )
-                return None
-
-            downloaded_path_str = stdout.decode().strip()
             if not downloaded_path_str:
                 LOGGER.error(
                     "yt-dlp finished but no output path returned for %s", video_id
@@ -361,6 +419,9 @@ class YouTubeUtils:
         except asyncio.TimeoutError:
             LOGGER.error("yt-dlp timed out for video ID: %s", video_id)
             return None
+        except yt_dlp.DownloadError as e:
+            LOGGER.error("yt-dlp failed for %s: %s", video_id, e)
+            return None
         except Exception as e:
             LOGGER.error(
                 "Unexpected error downloading %s: %r", video_id, e, exc_info=True
@@ -425,8 +486,7 @@ class YouTubeData(MusicService):
             return await self.get_info()
 
         try:
-            search = VideosSearch(self.query, limit=5)
-            results = await search.next()
+            results = await YouTubeUtils.cached_search(self.query, 5)
 
             if not results or not results.get("result"):
                 return types.Error(
@@ -434,7 +494,7 @@ class YouTubeData(MusicService):
                 )
 
             tracks = [
-                MusicTrack(**YouTubeUtils.format_track(video))
+                YouTubeUtils.format_music_track(video)
                 for video in results["result"]
             ]
             return PlatformTracks(tracks=tracks)
@@ -464,7 +524,7 @@ class YouTubeData(MusicService):
         if not data or not data.get("results"):
             return types.Error(code=404, message="Could not retrieve track details")
 
-        return await YouTubeUtils.create_track_info(data["results"][0])
+        return YouTubeUtils.create_track_info(data["results"][0])
 
     async def download_track(
         self, track: TrackInfo, video: bool = False
@@ -502,7 +562,7 @@ class YouTubeData(MusicService):
         Handles both videos and playlists.
         """
         try:
-            if YouTubeUtils.YOUTUBE_PLAYLIST_PATTERN.match(url):
+            if YouTubeUtils.classify_url(url) == "playlist":
                 LOGGER.debug(f"Processing YouTube playlist: {url}")
                 return await self._get_playlist_data(url)
 
@@ -515,7 +575,7 @@ class YouTubeData(MusicService):
     @staticmethod
     async def _get_video_data(url: str) -> Optional[Dict[str, Any]]:
         """Retrieve metadata for a single YouTube video."""
-        normalized_url = await YouTubeUtils.normalize_youtube_url(url)
+        normalized_url = YouTubeUtils.normalize_youtube_url(url)
         if not normalized_url:
             return None
 
@@ -525,13 +585,12 @@ class YouTubeData(MusicService):
 
         # Fall back to search API
         try:
-            search = VideosSearch(normalized_url, limit=1)
-            results = await search.next()
+            results = await YouTubeUtils.cached_search(normalized_url, 1)
 
             if not results or not results.get("result"):
                 return None
 
-            return {"results": [YouTubeUtils.format_track(results["result"][0])]}
+            return {"results": [YouTubeUtils.format_music_track(results["result"][0])]}
         except Exception as error:
             LOGGER.error(f"Video data fetch failed: {error}")
             return None
@@ -546,7 +605,7 @@ class YouTubeData(MusicService):
 
             return {
                 "results": [
-                    YouTubeUtils.format_track(track)
+                    YouTubeUtils.format_music_track(track)
                     for track in playlist["videos"]
                     if track.get("id")  # Filter valid tracks
                 ]
@@ -12,6 +12,9 @@ from TgMusic.logger import LOGGER
 from ._database import db
 
 admin_cache = TTLCache(maxsize=1000, ttl=60 * 60)
+_ADMIN_STATUSES = frozenset(
+    {"chatMemberStatusCreator", "chatMemberStatusAdministrator"}
+)
 
 
 class AdminCache:
@@ -21,6 +24,10 @@ class AdminCache:
         self.chat_id = chat_id
         self.user_info = user_info
         self.cached = cached
+        # user_id -> member, built once so lookups don't scan the admin list
+        self.by_user_id = {
+            member["member_id"]["user_id"]: member for member in user_info
+        }
 
 
 async def load_admin_cache(
@@ -57,14 +64,8 @@ async def get_admin_cache_user(
     if admin_list is None:
         return False, None  # Cache miss
 
-    return next(
-        (
-            (True, user_info)
-            for user_info in admin_list.user_info
-            if user_info["member_id"]["user_id"] == user_id
-        ),
-        (False, None),
-    )
+    user_info = admin_list.by_user_id.get(user_id)
+    return (True, user_info) if user_info is not None else (False, None)
 
 
 async def is_owner(chat_id: int, user_id: int) -> bool:
@@ -80,16 +81,12 @@ async def is_admin(chat_id: int, user_id: int) -> bool:
     """
     Check if the user is an admin (including the owner & auth) in the chat.
     """
-    is_cached, user = await get_admin_cache_user(chat_id, user_id)
-    user_status = user["status"]["@type"] if user else None
     if chat_id == user_id:
         return True  # Anon Admin
 
-    auth_users = await db.get_auth_users(chat_id)
-    if user_id in auth_users:
+    # Cached admin status is answered in memory; auth users only on a miss
+    is_cached, user = await get_admin_cache_user(chat_id, user_id)
+    if is_cached and user["status"]["@type"] in _ADMIN_STATUSES:
         return True
 
-    return is_cached and user_status in [
-        "chatMemberStatusCreator",
-        "chatMemberStatusAdministrator",
-    ]
+    return user_id in await db.get_auth_users(chat_id)
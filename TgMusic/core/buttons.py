@@ -2,6 +2,7 @@
 #  Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 #  Reimagined by Kumal | Fancy UI Edition 🎧
 
+from functools import lru_cache
 from typing import Literal
 from pytdbot import types
 from ._config import config
@@ -10,6 +11,8 @@ from ._config import config
 # ╔══════════════════════════════════╗
 #     🎛️ ꜰᴀɴᴄʏ ᴘʟᴀʏʙᴀᴄᴋ ᴄᴏɴᴛʀᴏʟꜱ
 # ╚══════════════════════════════════╝
+# Klavye yalnızca moda bağlı; her mod için bir kez oluşturulup yeniden kullanılır
+@lru_cache(maxsize=None)
 def control_buttons(mode: Literal["play", "pause", "resume"]) -> types.ReplyMarkupInlineKeyboard:
     prefix = "play"
 
@@ -23,7 +26,7 @@ def control_buttons(mode: Literal["play", "pause", "resume"]) -> types.ReplyMark
     stop_btn = btn("⏹️", "stop")
     pause_btn = btn("⏸️", "pause")
     resume_btn = btn("▶️", "resume")
-    close_btn = btn("✖️ kapat")
+    close_btn = btn("✖️ kapat", "close")
 
     # ☔ Mavi Duyuru bağlantısı (ꜰᴀɴᴄʏ ᴛᴇxᴛ)
     info_btn = types.InlineKeyboardButton(
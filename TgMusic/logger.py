@@ -2,8 +2,10 @@
 #  Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_FORMAT = (
     "[%(asctime)s - %(levelname)s] - %(name)s - "
@@ -23,9 +25,22 @@ file_handler = RotatingFileHandler(
 )
 file_handler.setFormatter(formatter)
 
+# Records are only enqueued on the calling thread (the event loop); a background
+# listener thread does the console and file writes
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+queue_listener = QueueListener(
+    log_queue, stream_handler, file_handler, respect_handler_level=True
+)
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
+queue_handler = QueueHandler(log_queue)
+# Only merge args into the message here; the listener's handlers apply LOG_FORMAT
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[stream_handler, file_handler],
+    handlers=[queue_handler],
 )
 
 # quiet down noisy libraries
@@ -2,6 +2,7 @@
 # GNU AGPL v3.0 Lisansı altında lisanslanmıştır: https://www.gnu.org/licenses/agpl-3.0.html
 # TgMusicBot projesinin bir parçasıdır. Uygulanabilir yerlerde tüm hakları saklıdır.
 
+import asyncio
 from typing import Union
 
 from pytdbot import Client, types
@@ -16,12 +17,7 @@ async def _validate_auth_command(msg: types.Message) -> Union[types.Message, Non
     if chat_id > 0:
         return None
 
-    if not await is_admin(chat_id, msg.from_id):
-        reply = await msg.reply_text("⛔ Bu komutu yalnızca grup yöneticisi kullanabilir.")
-        if isinstance(reply, types.Error):
-            LOGGER.warning(reply.message)
-        return None
-
+    # Senkron kontrol önce; geçersiz çağrılar hiçbir sorgu yapmadan döner
     if not msg.reply_to_message_id:
         reply = await msg.reply_text(
             "🔍 Bir kullanıcının izinlerini yönetmek için lütfen bir mesaja yanıt verin."
@@ -30,7 +26,16 @@ async def _validate_auth_command(msg: types.Message) -> Union[types.Message, Non
             LOGGER.warning(reply.message)
         return None
 
-    reply = await msg.getRepliedMessage()
+    # Yetki kontrolü ile yanıtlanan mesaj birbirinden bağımsız, birlikte alınır
+    admin, reply = await asyncio.gather(
+        is_admin(chat_id, msg.from_id), msg.getRepliedMessage()
+    )
+    if not admin:
+        reply = await msg.reply_text("⛔ Bu komutu yalnızca grup yöneticisi kullanabilir.")
+        if isinstance(reply, types.Error):
+            LOGGER.warning(reply.message)
+        return None
+
     if isinstance(reply, types.Error):
         reply = await msg.reply_text(f"⚠️ Hata: {reply.message}")
         if isinstance(reply, types.Error):
@@ -122,7 +127,7 @@ async def auth_list(c: Client, msg: types.Message) -> None:
         return
 
     text = "<b>🔐 Yetkili Kullanıcılar:</b>\n\n" + "\n".join(
-        [f"• <code>{uid}</code>" for uid in auth_users]
+        map("• <code>{}</code>".format, auth_users)
     )
     reply = await msg.reply_text(text)
     if isinstance(reply, types.Error):
@@ -4,48 +4,85 @@
 
 import asyncio
 import time
+from array import array
+from itertools import islice
 
 from pytdbot import Client, types
 
 from TgMusic.core import Filter, config, db
 from TgMusic.logger import LOGGER
-from TgMusic.modules.utils.play_helpers import del_msg, extract_argument
+from TgMusic.modules.utils.play_helpers import (
+    del_msg,
+    extract_argument,
+    get_retry_after,
+)
 
 # Yayın sınırlamaları
-REQUEST_LIMIT = 30
-BATCH_SIZE = 400
-BATCH_DELAY = 2
+REQUEST_LIMIT = 30  # saniye başına istek
+BATCH_SIZE = 400  # aynı anda oluşturulan görev sayısı
 MAX_RETRIES = 2
 
+
+class RateLimiter:
+    """İstekleri periyot başına en fazla `rate` olacak şekilde eşit aralıklara yayar."""
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        self._interval = period / rate
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> None:
+        now = time.monotonic()
+        wait = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+# Gönderim hızını saniyede 30 isteğe sabitler
+limiter = RateLimiter(REQUEST_LIMIT)
 # Aynı anda en fazla 30 istek gönderilmesini sağlar
 semaphore = asyncio.Semaphore(REQUEST_LIMIT)
 VALID_TARGETS = {"all", "users", "chats"}  # Geçerli hedef türleri
 
 
-async def get_broadcast_targets(target: str) -> tuple[list[int], list[int]]:
-    """Belirtilen hedef türüne göre kullanıcıları ve sohbetleri döndürür."""
-    users = await db.get_all_users() if target in {"all", "users"} else []
-    chats = await db.get_all_chats() if target in {"all", "chats"} else []
+async def get_broadcast_targets(target: str) -> tuple[array, array]:
+    """Belirtilen hedef türüne göre kullanıcıları ve sohbetleri döndürür.
+
+    Kimlikler int64 dizisinde tutulur; büyük listelerde Python int nesnelerine
+    göre yaklaşık 3,5 kat daha az bellek kullanır.
+    """
+    users = array("q", await db.get_all_users() if target in {"all", "users"} else ())
+    chats = array("q", await db.get_all_chats() if target in {"all", "chats"} else ())
     return users, chats
 
 
+def build_broadcast_content(
+    message: types.Message, is_copy: bool
+) -> types.InputMessageForwarded:
+    """Yayın içeriğini bir kez oluşturur; her hedef için aynı nesne kullanılır."""
+    return types.InputMessageForwarded(
+        from_chat_id=message.chat_id,
+        message_id=message.id,
+        copy_options=types.MessageCopyOptions(send_copy=is_copy),
+    )
+
+
 async def send_message_with_retry(
-    target_id: int, message: types.Message, is_copy: bool
+    c: Client, target_id: int, content: types.InputMessageForwarded
 ) -> int:
     """Bir mesajı hedefe gönderir; hata durumunda tekrar dener."""
     for attempt in range(1, MAX_RETRIES + 1):
-        async with semaphore:
-            result = await (
-                message.copy(target_id) if is_copy else message.forward(target_id)
+        async with limiter, semaphore:
+            result = await c.sendMessage(
+                chat_id=target_id, input_message_content=content
             )
 
             if isinstance(result, types.Error):
                 if result.code == 429:  # FloodWait hatası
-                    retry_after = (
-                        int(result.message.split("retry after ")[1])
-                        if "retry after" in result.message
-                        else 1
-                    )
+                    retry_after = get_retry_after(result, 1)
                     LOGGER.warning(
                         "[FloodWait] Deneme %s/%s: %ss bekleniyor → %s",
                         attempt,
@@ -82,46 +119,39 @@ async def send_message_with_retry(
 
 
 async def broadcast_to_targets(
-    targets: list[int], message: types.Message, is_copy: bool
+    c: Client, targets: array, content: types.InputMessageForwarded
 ) -> tuple[int, int]:
     """Belirtilen hedeflere toplu yayın yapar."""
-    sent = failed = 0
-
-    async def process_batch(_batch: list[int], index: int):
-        results = await asyncio.gather(
-            *[send_message_with_retry(tid, message, is_copy) for tid in _batch]
-        )
-        _batch_sent = sum(results)
-        _batch_failed = len(_batch) - _batch_sent
-        LOGGER.info(
-            "Toplu işlem %s → Gönderilen: %s | Başarısız: %s",
-            index + 1,
-            _batch_sent,
-            _batch_failed,
-        )
-        return _batch_sent, _batch_failed
+    sent = done = 0
+    total = len(targets)
+
+    # Hız sınırlayıcı gönderimleri zaten yaydığı için partiler arasında beklemeye gerek yok.
+    # Hedefler kopyalanmadan parça parça işlenir; bellekte en fazla BATCH_SIZE görev tutulur.
+    it = iter(targets)
+    while chunk := list(islice(it, BATCH_SIZE)):
+        tasks = [
+            asyncio.create_task(send_message_with_retry(c, tid, content))
+            for tid in chunk
+        ]
+        for task in asyncio.as_completed(tasks):
+            sent += await task
+            done += 1
 
-    # Hedefleri 400’lük parçalara ayırır
-    batches = [targets[i : i + BATCH_SIZE] for i in range(0, len(targets), BATCH_SIZE)]
-    for idx, batch in enumerate(batches):
         LOGGER.info(
-            "Gönderiliyor (%s/%s) → %s hedef",
-            idx + 1,
-            len(batches),
-            len(batch),
+            "İlerleme %s/%s → Gönderilen: %s | Başarısız: %s",
+            done,
+            total,
+            sent,
+            done - sent,
         )
-        batch_sent, batch_failed = await process_batch(batch, idx)
-        sent += batch_sent
-        failed += batch_failed
-        await asyncio.sleep(BATCH_DELAY)
 
-    return sent, failed
+    return sent, total - sent
 
 
 @Client.on_message(filters=Filter.command("broadcast"))
 async def broadcast(c: Client, message: types.Message) -> None:
     """Bot sahibinin tüm kullanıcı ve gruplara mesaj yayınlamasını sağlar."""
-    if int(message.from_id) != config.OWNER_ID:
+    if message.from_id != config.OWNER_ID:
         await del_msg(message)
         return None
 
@@ -181,8 +211,12 @@ async def broadcast(c: Client, message: types.Message) -> None:
         return None
 
     start_time = time.monotonic()
-    user_sent, user_failed = await broadcast_to_targets(users, reply, is_copy)
-    chat_sent, chat_failed = await broadcast_to_targets(chats, reply, is_copy)
+    # Kullanıcı ve sohbet yayınları aynı sınırlayıcıyı paylaştığı için birlikte yürütülür
+    content = build_broadcast_content(reply, is_copy)
+    (user_sent, user_failed), (chat_sent, chat_failed) = await asyncio.gather(
+        broadcast_to_targets(c, users, content),
+        broadcast_to_targets(c, chats, content),
+    )
     end_time = time.monotonic()
 
     reply = await started.edit_text(
@@ -2,6 +2,10 @@
 #  GNU AGPL v3.0 Lisansı altında lisanslanmıştır: https://www.gnu.org/licenses/agpl-3.0.html
 #  TgMusicBot projesinin bir parçasıdır. Uygulanabilir yerlerde tüm hakları saklıdır.
 
+import asyncio
+from typing import Optional, Union
+
+from cachetools import TTLCache
 from pytdbot import Client, types
 
 from TgMusic.core import Filter, control_buttons, chat_cache, db, call
@@ -11,170 +15,246 @@ from .progress_handler import _handle_play_c_data
 from .utils.play_helpers import edit_text
 from ..core import DownloaderWrapper
 
+# Yönetici kontrolü gerektiren işlemler
+_ADMIN_ACTIONS = frozenset(
+    {"play_skip", "play_stop", "play_pause", "play_resume", "play_close"}
+)
+# Aktif oturum gerektiren işlemler
+_ACTIVE_ACTIONS = frozenset(
+    {"play_skip", "play_stop", "play_pause", "play_resume", "play_timer"}
+)
 
-@Client.on_updateNewCallbackQuery(filters=Filter.regex(r"(c)?play_\w+"))
-async def callback_query(c: Client, message: types.UpdateNewCallbackQuery) -> None:
-    """Müzik kontrol butonlarına verilen geri bildirimleri işler (duraklat, devam, geç, durdur vb.)."""
-    data = message.payload.data.decode()
-    user_id = message.sender_user_id
+# Kullanıcı adları nadiren değişir; her geri bildirimde getUser çağrılmaz
+_USER_NAMES = TTLCache(maxsize=50_000, ttl=600)
 
-    # Mesaj ve kullanıcı bilgilerini al
-    get_msg = await message.getMessage()
-    if isinstance(get_msg, types.Error):
-        c.logger.warning(f"Mesaj alınamadı: {get_msg.message}")
-        return None
+DELETE_FLUSH_INTERVAL = 0.05  # saniye
+DELETE_BATCH_LIMIT = 100  # deleteMessages çağrısı başına en fazla mesaj
+
+
+class _DeleteBatcher:
+    """Silinecek mesajları sohbet başına toplar ve kısa aralıklarla toplu siler."""
+
+    def __init__(self) -> None:
+        self._pending: dict[int, list[int]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def submit(self, c: Client, chat_id: int, message_id: int) -> None:
+        self._pending.setdefault(chat_id, []).append(message_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush(c))
+
+    async def _flush(self, c: Client) -> None:
+        await asyncio.sleep(DELETE_FLUSH_INTERVAL)
+        # Silme sırasında gelen yeni istekler de aynı görevde boşaltılır
+        while self._pending:
+            pending, self._pending = self._pending, {}
+            for chat_id, message_ids in pending.items():
+                try:
+                    await self._delete_chat(c, chat_id, message_ids)
+                except Exception as e:
+                    c.logger.warning(f"Mesajlar silinemedi ({chat_id}): {e}")
+
+    @staticmethod
+    async def _delete_chat(c: Client, chat_id: int, message_ids: list[int]) -> None:
+        for i in range(0, len(message_ids), DELETE_BATCH_LIMIT):
+            result = await c.deleteMessages(
+                chat_id, message_ids[i : i + DELETE_BATCH_LIMIT], revoke=True
+            )
+            if isinstance(result, types.Error):
+                c.logger.warning(f"Mesajlar silinemedi: {result.message}")
+
+
+_delete_batcher = _DeleteBatcher()
+
+
+async def _get_user_name(c: Client, user_id: int) -> Union[str, types.Error]:
+    """Kullanıcının adını önbellekten, yoksa Telegram'dan döndürür."""
+    if (name := _USER_NAMES.get(user_id)) is not None:
+        return name
 
     user = await c.getUser(user_id)
     if isinstance(user, types.Error):
-        c.logger.warning(f"Kullanıcı bilgisi alınamadı: {user.message}")
+        return user
+
+    _USER_NAMES[user_id] = user.first_name
+    return user.first_name
+
+
+# Sabit kontrol işlemleri; hepsi (c, message, chat_id, user_name, send_response) alır
+async def _do_skip(c, message, chat_id, user_name, send_response) -> None:
+    """Şarkı atlama"""
+    result = await call.play_next(chat_id)
+    if isinstance(result, types.Error):
+        return await send_response(
+            f"⚠️ Şarkı atlanamadı.\n<b>Detay:</b> {result.message}", alert=True
+        )
+    return await send_response("⏭️ Şarkı başarıyla **atlandı** 🎶", delete=True)
+
+
+async def _do_stop(c, message, chat_id, user_name, send_response) -> None:
+    """Oynatmayı durdurma"""
+    result = await call.end(chat_id)
+    if isinstance(result, types.Error):
+        return await send_response(
+            f"⚠️ Oynatma durdurulamadı.\n{result.message}", alert=True
+        )
+    return await send_response(
+        f"<b>⏹️ Müzik Durduruldu</b>\n🎧 İstek: {user_name}"
+    )
+
+
+async def _do_pause(c, message, chat_id, user_name, send_response) -> None:
+    """Oynatmayı duraklatma"""
+    result = await call.pause(chat_id)
+    if isinstance(result, types.Error):
+        return await send_response(
+            f"⚠️ Duraklatma başarısız.\n{result.message}", alert=True
+        )
+    markup = (
+        control_buttons("pause") if await db.get_buttons_status(chat_id) else None
+    )
+    return await send_response(
+        f"<b>⏸️ Şarkı duraklatıldı.</b>\n🎧 {user_name} tarafından duraklatıldı.",
+        reply_markup=markup,
+    )
+
+
+async def _do_resume(c, message, chat_id, user_name, send_response) -> None:
+    """Oynatmaya devam etme"""
+    result = await call.resume(chat_id)
+    if isinstance(result, types.Error):
+        return await send_response(
+            f"⚠️ Devam ettirilemedi.\n{result.message}", alert=True
+        )
+    markup = (
+        control_buttons("resume") if await db.get_buttons_status(chat_id) else None
+    )
+    return await send_response(
+        f"<b>▶️ Müzik devam ediyor!</b>\n🎶 {user_name} tarafından başlatıldı.",
+        reply_markup=markup,
+    )
+
+
+async def _do_close(c, message, chat_id, user_name, send_response) -> None:
+    """Arayüz kapatma"""
+    delete_result = await c.deleteMessages(
+        chat_id, [message.message_id], revoke=True
+    )
+    if isinstance(delete_result, types.Error):
+        await message.answer(
+            f"⚠️ Arayüz kapatılamadı.\n{delete_result.message}", show_alert=True
+        )
         return None
+    await message.answer("✅ Arayüz başarıyla kapatıldı.", show_alert=True)
+    return None
+
 
-    await load_admin_cache(c, message.chat_id)
-    user_name = user.first_name
-
-    # Yönetici kontrolü gerektiren işlemler
-    def requires_admin(action: str) -> bool:
-        return action in {
-            "play_skip",
-            "play_stop",
-            "play_pause",
-            "play_resume",
-            "play_close",
-        }
-
-    # Aktif oturum gerektiren işlemler
-    def requires_active_chat(action: str) -> bool:
-        return action in {
-            "play_skip",
-            "play_stop",
-            "play_pause",
-            "play_resume",
-            "play_timer",
-        }
+def _parse_song_payload(data: str) -> Optional[tuple[str, str]]:
+    """(c)play_<platform>_<song_id> verisini tek geçişte (platform, song_id) olarak ayırır."""
+    _, _, rest = data.partition("_")
+    platform, sep, song_id = rest.partition("_")
+    return (platform, song_id) if sep else None
+
+
+_HANDLERS = {
+    "play_skip": _do_skip,
+    "play_stop": _do_stop,
+    "play_pause": _do_pause,
+    "play_resume": _do_resume,
+    "play_close": _do_close,
+}
+
+
+@Client.on_updateNewCallbackQuery(filters=Filter.regex(r"\A(c)?play_"))
+async def callback_query(c: Client, message: types.UpdateNewCallbackQuery) -> None:
+    """Müzik kontrol butonlarına verilen geri bildirimleri işler (duraklat, devam, geç, durdur vb.)."""
+    data = message.payload.data.decode()
+    user_id = message.sender_user_id
+
+    # Kullanıcı ve yönetici bilgileri birbirinden bağımsız; tek turda alınır
+    user_name, _ = await asyncio.gather(
+        _get_user_name(c, user_id),
+        load_admin_cache(c, message.chat_id),
+    )
+    if isinstance(user_name, types.Error):
+        c.logger.warning(f"Kullanıcı bilgisi alınamadı: {user_name.message}")
+        return None
 
     # Standart yanıt gönderici
     async def send_response(
         msg: str, alert: bool = False, delete: bool = False, reply_markup=None
     ) -> None:
+        # Uyarılar yalnızca answer ile gider; mesaj içeriğine bakılmaz
         if alert:
             await message.answer(msg, show_alert=True)
-        else:
-            edit_func = (
-                message.edit_message_caption
-                if get_msg.caption
-                else message.edit_message_text
-            )
-            await edit_func(msg, reply_markup=reply_markup)
+            return None
+
+        # Mesaj yalnızca düzenleme gerektiğinde alınır; uyarılar için gerekmez
+        get_msg = await message.getMessage()
+        if isinstance(get_msg, types.Error):
+            c.logger.warning(f"Mesaj alınamadı: {get_msg.message}")
+            return None
+
+        edit_func = (
+            message.edit_message_caption
+            if get_msg.caption
+            else message.edit_message_text
+        )
+        await edit_func(msg, reply_markup=reply_markup)
 
         if delete:
-            _del_result = await c.deleteMessages(
-                message.chat_id, [message.message_id], revoke=True
-            )
-            if isinstance(_del_result, types.Error):
-                c.logger.warning(f"Mesaj silinemedi: {_del_result.message}")
+            _delete_batcher.submit(c, message.chat_id, message.message_id)
 
     # Yönetici yetkisi kontrolü
-    if requires_admin(data) and not await is_admin(message.chat_id, user_id):
+    if data in _ADMIN_ACTIONS and not await is_admin(message.chat_id, user_id):
         await message.answer(
             "⛔ Bu işlemi yapmak için **yönetici yetkisi** gerekiyor.", show_alert=True
         )
         return None
 
     chat_id = message.chat_id
-    if requires_active_chat(data) and not chat_cache.is_active(chat_id):
-        return await send_response(
-            "🎧 Şu anda bu sohbette aktif bir müzik çalma yok.", alert=True
-        )
-
-    # 🔹 Şarkı atlama
-    if data == "play_skip":
-        result = await call.play_next(chat_id)
-        if isinstance(result, types.Error):
-            return await send_response(
-                f"⚠️ Şarkı atlanamadı.\n<b>Detay:</b> {result.message}", alert=True
-            )
-        return await send_response("⏭️ Şarkı başarıyla **atlandı** 🎶", delete=True)
-
-    # 🔹 Oynatmayı durdurma
-    if data == "play_stop":
-        result = await call.end(chat_id)
-        if isinstance(result, types.Error):
-            return await send_response(
-                f"⚠️ Oynatma durdurulamadı.\n{result.message}", alert=True
-            )
-        return await send_response(
-            f"<b>⏹️ Müzik Durduruldu</b>\n🎧 İstek: {user_name}"
-        )
-
-    # 🔹 Oynatmayı duraklatma
-    if data == "play_pause":
-        result = await call.pause(chat_id)
-        if isinstance(result, types.Error):
-            return await send_response(
-                f"⚠️ Duraklatma başarısız.\n{result.message}", alert=True
-            )
-        markup = (
-            control_buttons("pause") if await db.get_buttons_status(chat_id) else None
-        )
-        return await send_response(
-            f"<b>⏸️ Şarkı duraklatıldı.</b>\n🎧 {user_name} tarafından duraklatıldı.",
-            reply_markup=markup,
-        )
-
-    # 🔹 Oynatmaya devam etme
-    if data == "play_resume":
-        result = await call.resume(chat_id)
-        if isinstance(result, types.Error):
-            return await send_response(
-                f"⚠️ Devam ettirilemedi.\n{result.message}", alert=True
-            )
-        markup = (
-            control_buttons("resume") if await db.get_buttons_status(chat_id) else None
-        )
-        return await send_response(
-            f"<b>▶️ Müzik devam ediyor!</b>\n🎶 {user_name} tarafından başlatıldı.",
-            reply_markup=markup,
-        )
-
-    # 🔹 Arayüz kapatma
-    if data == "play_close":
-        delete_result = await c.deleteMessages(
-            chat_id, [message.message_id], revoke=True
+    if data in _ACTIVE_ACTIONS and not chat_cache.is_active(chat_id):
+        await message.answer(
+            "🎧 Şu anda bu sohbette aktif bir müzik çalma yok.", show_alert=True
         )
-        if isinstance(delete_result, types.Error):
-            await message.answer(
-                f"⚠️ Arayüz kapatılamadı.\n{delete_result.message}", show_alert=True
-            )
-            return None
-        await message.answer("✅ Arayüz başarıyla kapatıldı.", show_alert=True)
         return None
 
+    # 🔹 Sabit kontrol işlemleri
+    if (handler := _HANDLERS.get(data)) is not None:
+        return await handler(c, message, chat_id, user_name, send_response)
+
     # 🔹 Playlist veya zamanlayıcı işlemleri
     if data.startswith("play_c_"):
         return await _handle_play_c_data(data, message, chat_id, user_id, user_name, c)
 
     # 🔹 Şarkı oynatma istekleri
-    try:
-        _, platform, song_id = data.split("_", 2)
-    except ValueError:
+    parsed = _parse_song_payload(data)
+    if parsed is None:
         c.logger.error(f"Hatalı callback verisi alındı: {data}")
         return await send_response("⚠️ Geçersiz istek biçimi.", alert=True)
 
+    platform, song_id = parsed
+
+    url = _get_platform_url(platform, song_id)
+    # Şarkı bilgisi, "aranıyor" mesajları gönderilirken arka planda alınır
+    info_task = asyncio.create_task(DownloaderWrapper(url).get_info()) if url else None
+
     await message.answer(f"🎵 {user_name} için şarkı hazırlanıyor...", show_alert=True)
     reply = await message.edit_message_text(
         f"🔍 Şarkı aranıyor...\n👤 İstek: {user_name}"
     )
     if isinstance(reply, types.Error):
         c.logger.warning(f"Mesaj düzenlenemedi: {reply.message}")
+        if info_task:
+            info_task.cancel()
         return None
 
-    url = _get_platform_url(platform, song_id)
-    if not url:
+    if not info_task:
         c.logger.error(f"Desteklenmeyen platform: {platform} | Veri: {data}")
         await edit_text(reply, text=f"⚠️ Bu platform desteklenmiyor: {platform}")
         return None
 
-    song = await DownloaderWrapper(url).get_info()
+    song = await info_task
     if song:
         if isinstance(song, types.Error):
             await edit_text(reply, text=f"⚠️ Şarkı alınamadı.\n{song.message}")
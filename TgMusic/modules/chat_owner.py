@@ -2,56 +2,64 @@
 # GNU AGPL v3.0 Lisansı altında lisanslanmıştır: https://www.gnu.org/licenses/agpl-3.0.html
 # TgMusicBot projesinin bir parçasıdır. Uygulanabilir yerlerde tüm hakları saklıdır.
 
+import asyncio
+
 from pytdbot import Client, types
 
 from TgMusic.core import Filter, db, is_owner
 from TgMusic.logger import LOGGER
 from TgMusic.modules.utils.play_helpers import extract_argument
 
+_TOGGLE_ON = frozenset({"on", "enable"})
+_TOGGLE_OFF = frozenset({"off", "disable"})
+
+
+async def _safe_reply(msg: types.Message, text: str) -> None:
+    """Mesaja yanıt verir; hata olursa yalnızca loglar."""
+    reply = await msg.reply_text(text)
+    if isinstance(reply, types.Error):
+        LOGGER.warning(reply.message)
+
 
 @Client.on_message(filters=Filter.command(["buttons"]))
 async def buttons(_: Client, msg: types.Message) -> None:
     """Buton kontrol sistemini aç/kapat."""
     chat_id = msg.chat_id
     if chat_id > 0:
-        reply = await msg.reply_text("❌ Bu komut yalnızca gruplarda kullanılabilir.")
-        if isinstance(reply, types.Error):
-            LOGGER.warning(reply.message)
-        return
-
-    if not await is_owner(chat_id, msg.from_id):
-        reply = await msg.reply_text("⛔ Bu işlemi yalnızca **grup sahibi** gerçekleştirebilir.")
-        if isinstance(reply, types.Error):
-            LOGGER.warning(reply.message)
-        return
-
-    current = await db.get_buttons_status(chat_id)
+        return await _safe_reply(msg, "❌ Bu komut yalnızca gruplarda kullanılabilir.")
+
+    # Sahiplik kontrolü ve mevcut ayar birbirinden bağımsız, birlikte okunur
+    owner, current = await asyncio.gather(
+        is_owner(chat_id, msg.from_id), db.get_buttons_status(chat_id)
+    )
+    if not owner:
+        return await _safe_reply(
+            msg, "⛔ Bu işlemi yalnızca **grup sahibi** gerçekleştirebilir."
+        )
+
     args = extract_argument(msg.text)
 
     if not args:
         status = "aktif ✅" if current else "devre dışı ❌"
-        reply = await msg.reply_text(
+        return await _safe_reply(
+            msg,
             f"⚙️ <b>Buton Kontrol Durumu:</b> {status}\n\n"
-            "Kullanım: <code>/buttons [on|off|enable|disable]</code>"
+            "Kullanım: <code>/buttons [on|off|enable|disable]</code>",
         )
-        if isinstance(reply, types.Error):
-            LOGGER.warning(reply.message)
-        return
 
     arg = args.lower()
-    if arg in ["on", "enable"]:
+    if arg in _TOGGLE_ON:
         await db.set_buttons_status(chat_id, True)
-        reply = await msg.reply_text("✅ Butonlar etkinleştirildi! Artık kontrol butonları aktif 🎵")
-    elif arg in ["off", "disable"]:
+        text = "✅ Butonlar etkinleştirildi! Artık kontrol butonları aktif 🎵"
+    elif arg in _TOGGLE_OFF:
         await db.set_buttons_status(chat_id, False)
-        reply = await msg.reply_text("❌ Butonlar devre dışı bırakıldı. Kontrol butonları artık gizlenecek.")
+        text = "❌ Butonlar devre dışı bırakıldı. Kontrol butonları artık gizlenecek."
     else:
-        reply = await msg.reply_text(
+        text = (
             "⚠️ Hatalı kullanım!\n"
             "Doğru kullanım: <code>/buttons [enable|disable|on|off]</code>"
         )
-    if isinstance(reply, types.Error):
-        LOGGER.warning(reply.message)
+    await _safe_reply(msg, text)
 
 
 @Client.on_message(filters=Filter.command(["thumbnail", "thumb"]))
@@ -59,41 +67,37 @@ async def thumbnail(_: Client, msg: types.Message) -> None:
     """Küçük resim (thumbnail) ayarlarını aç/kapat."""
     chat_id = msg.chat_id
     if chat_id > 0:
-        reply = await msg.reply_text("❌ Bu komut yalnızca gruplarda kullanılabilir.")
-        if isinstance(reply, types.Error):
-            LOGGER.warning(reply.message)
-        return
-
-    if not await is_owner(chat_id, msg.from_id):
-        reply = await msg.reply_text("⛔ Bu işlemi yalnızca **grup sahibi** gerçekleştirebilir.")
-        if isinstance(reply, types.Error):
-            LOGGER.warning(reply.message)
-        return
-
-    current = await db.get_thumbnail_status(chat_id)
+        return await _safe_reply(msg, "❌ Bu komut yalnızca gruplarda kullanılabilir.")
+
+    # Sahiplik kontrolü ve mevcut ayar birbirinden bağımsız, birlikte okunur
+    owner, current = await asyncio.gather(
+        is_owner(chat_id, msg.from_id), db.get_thumbnail_status(chat_id)
+    )
+    if not owner:
+        return await _safe_reply(
+            msg, "⛔ Bu işlemi yalnızca **grup sahibi** gerçekleştirebilir."
+        )
+
     args = extract_argument(msg.text)
 
     if not args:
         status = "aktif ✅" if current else "devre dışı ❌"
-        reply = await msg.reply_text(
+        return await _safe_reply(
+            msg,
             f"🖼️ <b>Küçük Resim Durumu:</b> {status}\n\n"
-            "Kullanım: <code>/thumbnail [on|off|enable|disable]</code>"
+            "Kullanım: <code>/thumbnail [on|off|enable|disable]</code>",
         )
-        if isinstance(reply, types.Error):
-            LOGGER.warning(reply.message)
-        return
 
     arg = args.lower()
-    if arg in ["on", "enable"]:
+    if arg in _TOGGLE_ON:
         await db.set_thumbnail_status(chat_id, True)
-        reply = await msg.reply_text("✅ Küçük resimler **etkinleştirildi!** Artık oynatma görselleri gösterilecek 🖼️")
-    elif arg in ["off", "disable"]:
+        text = "✅ Küçük resimler **etkinleştirildi!** Artık oynatma görselleri gösterilecek 🖼️"
+    elif arg in _TOGGLE_OFF:
         await db.set_thumbnail_status(chat_id, False)
-        reply = await msg.reply_text("❌ Küçük resimler **devre dışı bırakıldı.** Görseller gizlenecek.")
+        text = "❌ Küçük resimler **devre dışı bırakıldı.** Görseller gizlenecek."
     else:
-        reply = await msg.reply_text(
+        text = (
             "⚠️ Hatalı kullanım!\n"
             "Doğru kullanım: <code>/thumbnail [enable|disable|on|off]</code>"
         )
-    if isinstance(reply, types.Error):
-        LOGGER.warning(reply.message)
\ No newline at end of file
+    await _safe_reply(msg, text)
@@ -2,6 +2,8 @@
 # GNU AGPL v3.0 Lisansı altında lisanslanmıştır: https://www.gnu.org/licenses/agpl-3.0.html
 # TgMusicBot projesinin bir parçasıdır. Uygulanabilir yerlerde tüm hakları saklıdır.
 
+import asyncio
+import contextlib
 import inspect
 import io
 import os
@@ -16,6 +18,7 @@ from html import escape
 from sys import version as pyver
 from typing import Any, Optional, Tuple, Union
 
+import aiofiles
 import psutil
 from meval import meval
 from ntgcalls import __version__ as ntgver
@@ -26,6 +29,7 @@ from pytgcalls import __version__ as pytgver
 
 from TgMusic import StartTime
 from TgMusic.core import Filter, chat_cache, config, call, db
+from TgMusic.logger import LOGGER
 from TgMusic.modules.utils.play_helpers import del_msg, extract_argument
 
 
@@ -36,10 +40,12 @@ def format_exception(
     if tb is None:
         tb = traceback.extract_tb(exp.__traceback__)
 
-    cwd = os.getcwd()
+    # Çalışma dizini altındaki yollar önek kesilerek göreli yapılır (relpath gerekmez)
+    cwd_prefix = os.getcwd() + os.sep
+    prefix_len = len(cwd_prefix)
     for frame in tb:
-        if cwd in frame.filename:
-            frame.filename = os.path.relpath(frame.filename)
+        if frame.filename.startswith(cwd_prefix):
+            frame.filename = frame.filename[prefix_len:]
 
     stack = "".join(traceback.format_list(tb))
     msg = str(exp)
@@ -49,10 +55,16 @@ def format_exception(
     return f"Traceback (most recent call last):\n{stack}{type(exp).__name__}{msg}"
 
 
+def _remove_file(path: str) -> None:
+    """Dosyayı siler; hiç oluşturulmamışsa sessizce geçer."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
 @Client.on_message(filters=Filter.command("eval"))
 async def exec_eval(c: Client, m: types.Message) -> None:
     """Python kodlarını doğrudan Telegram üzerinden çalıştırır (yalnızca bot sahibine özel)."""
-    if int(m.from_id) != config.OWNER_ID:
+    if m.from_id != config.OWNER_ID:
         return None
 
     text = m.text.split(None, 1)
@@ -112,7 +124,8 @@ async def exec_eval(c: Client, m: types.Message) -> None:
             return "⚠️ Hata:\n\n", formatted_tb
 
     prefix, result = await _eval()
-    if not out_buf.getvalue() or result is not None:
+    # tell() boşluğu kopya oluşturmadan söyler; içerik yalnızca bir kez alınır
+    if not out_buf.tell() or result is not None:
         print(result, file=out_buf)
 
     out = out_buf.getvalue().rstrip()
@@ -123,50 +136,78 @@ async def exec_eval(c: Client, m: types.Message) -> None:
 
     if len(result) > 2000:
         filename = f"database/{uuid.uuid4().hex}.txt"
-        with open(filename, "w", encoding="utf-8") as file:
-            file.write(out)
-
         caption = f"{prefix}<b>🔹 Kod:</b>\n<pre language='python'>{escape(code)}</pre>"
-        reply = await m.reply_document(
-            document=types.InputFileLocal(filename),
-            caption=caption,
-            disable_notification=True,
-            parse_mode="html",
-        )
-        if isinstance(reply, types.Error):
-            c.logger.warning(reply.message)
-        os.remove(filename)
+        try:
+            # Dosya işlemleri olay döngüsünü bloklamasın
+            async with aiofiles.open(filename, "w", encoding="utf-8") as file:
+                await file.write(out)
+
+            reply = await m.reply_document(
+                document=types.InputFileLocal(filename),
+                caption=caption,
+                disable_notification=True,
+                parse_mode="html",
+            )
+            if isinstance(reply, types.Error):
+                c.logger.warning(reply.message)
+        finally:
+            # Yazma veya gönderim hata fırlatsa bile geçici dosya geride kalmaz
+            await asyncio.to_thread(_remove_file, filename)
         return None
 
     reply = await m.reply_text(str(result), parse_mode="html")
     if isinstance(reply, types.Error):
         c.logger.warning(reply.message)
 
+# Çalışma süresince değişmeyen bilgiler; içe aktarmada bir kez hesaplanır
+_STATIC: dict[str, Any] = {
+    # Sistem Bilgileri
+    "hostname": socket.gethostname(),
+    "mac_address": ":".join(re.findall("..", f"{uuid.getnode():012x}")),
+    "architecture": platform.machine(),
+    "system": platform.system(),
+    "release": platform.release(),
+    "processor": platform.processor() or "Bilinmiyor",
+    "cores_physical": psutil.cpu_count(logical=False),
+    "cores_total": psutil.cpu_count(logical=True),
+    "python": pyver.split()[0],
+}
+
+# Sürüm bölümü tamamen sabittir; /stats yanıtına hazır metin olarak eklenir
+_VERSIONS_TEXT = f"""<b>📦 Yazılım Sürümleri:</b>
+• Python: <code>{_STATIC['python']}</code>
+• Pyrogram: <code>{pyrover}</code>
+• PyTgCalls: <code>{pytgver}</code>
+• NTgCalls: <code>{ntgver}</code>
+• PyTdBot: <code>{py_td_ver}</code>"""
 
-@Client.on_message(filters=Filter.command("stats"))
-async def sys_stats(client: Client, message: types.Message) -> None:
-    """Botun sistem durumu ve kaynak kullanımını gösterir (CPU, RAM, Disk, Ağ, Versiyonlar)."""
-    if message.from_id not in config.DEVS:
-        await del_msg(message)
-        return None
+CPU_SAMPLE_INTERVAL = 5  # saniye
+# Son CPU ölçümü; /stats beklemeden bu değeri okur
+_cpu_percent: Optional[float] = None
+_cpu_sampler: Optional[asyncio.Task] = None
 
-    sys_msg = await message.reply_text("📊 Sistem istatistikleri toplanıyor...")
-    if isinstance(sys_msg, types.Error):
-        client.logger.warning(sys_msg.message)
 
-    # Sistem Bilgileri
-    hostname = socket.gethostname()
-    ip_address = socket.gethostbyname(hostname)
-    mac_address = ":".join(re.findall("..", f"{uuid.getnode():012x}"))
-    architecture = platform.machine()
-    system = platform.system()
-    release = platform.release()
-    processor = platform.processor() or "Bilinmiyor"
+async def _sample_cpu() -> None:
+    """CPU kullanımını arka planda periyodik olarak ölçer."""
+    global _cpu_percent
+    psutil.cpu_percent(interval=None)  # ilk çağrı yalnızca referans noktası oluşturur
+    while True:
+        await asyncio.sleep(CPU_SAMPLE_INTERVAL)
+        _cpu_percent = psutil.cpu_percent(interval=None)
 
+
+def _ensure_cpu_sampler() -> None:
+    global _cpu_sampler
+    if _cpu_sampler is None or _cpu_sampler.done():
+        _cpu_sampler = asyncio.create_task(_sample_cpu())
+
+
+def _collect_stats() -> dict[str, Any]:
+    """Bloklayıcı sistem çağrılarını toplar; olay döngüsü dışında çalıştırılır."""
+    stats = dict(_STATIC)
+    stats["ip_address"] = socket.gethostbyname(stats["hostname"])
     # Donanım Bilgileri
-    ram = psutil.virtual_memory()
-    cores_physical = psutil.cpu_count(logical=False)
-    cores_total = psutil.cpu_count(logical=True)
+    stats["ram"] = psutil.virtual_memory()
 
     try:
         cpu_freq = psutil.cpu_freq()
@@ -178,25 +219,50 @@ async def sys_stats(client: Client, message: types.Message) -> None:
         if cpu_freq.max:
             cpu_freq_str += f" (Maks: {cpu_freq.max / 1000:.2f} GHz)"
     except Exception as e:
-        client.logger.warning("CPU frekansı alınamadı: %s", e)
+        LOGGER.warning("CPU frekansı alınamadı: %s", e)
         cpu_freq_str = "Ulaşılamıyor"
+    stats["cpu_freq_str"] = cpu_freq_str
 
     # Disk Bilgileri
-    disk = psutil.disk_usage("/")
-    disk_io = psutil.disk_io_counters()
+    stats["disk"] = psutil.disk_usage("/")
+    stats["disk_io"] = psutil.disk_io_counters()
 
     # Ağ Bilgileri
-    net_io = psutil.net_io_counters()
-    net_if = psutil.net_if_addrs()
+    stats["net_io"] = psutil.net_io_counters()
+    stats["net_if"] = psutil.net_if_addrs()
+
+    stats["load_avg"] = (
+        ", ".join([f"{x:.2f}" for x in psutil.getloadavg()])
+        if hasattr(psutil, "getloadavg")
+        else "N/A"
+    )
+    # Örnekleyici henüz ölçüm yapmadıysa (ilk /stats) bir kez bekleyerek ölçülür
+    stats["cpu_percent"] = (
+        _cpu_percent if _cpu_percent is not None else psutil.cpu_percent(interval=1)
+    )
+    return stats
+
+
+@Client.on_message(filters=Filter.command("stats"))
+async def sys_stats(client: Client, message: types.Message) -> None:
+    """Botun sistem durumu ve kaynak kullanımını gösterir (CPU, RAM, Disk, Ağ, Versiyonlar)."""
+    if message.from_id not in config.DEVS:
+        await del_msg(message)
+        return None
+
+    sys_msg = await message.reply_text("📊 Sistem istatistikleri toplanıyor...")
+    if isinstance(sys_msg, types.Error):
+        client.logger.warning(sys_msg.message)
+
+    _ensure_cpu_sampler()
+    # psutil ve DNS çağrıları bloklayıcıdır (cpu_percent 1 sn bekler); ayrı iş parçacığında toplanır
+    stats, (chats, users) = await asyncio.gather(
+        asyncio.to_thread(_collect_stats),
+        asyncio.gather(db.count_chats(), db.count_users()),
+    )
 
     # Çalışma Süresi
     uptime = timedelta(seconds=int((datetime.now() - StartTime).total_seconds()))
-    load_avg = ", ".join([f"{x:.2f}" for x in psutil.getloadavg()]) if hasattr(psutil, "getloadavg") else "N/A"
-    cpu_percent = psutil.cpu_percent(interval=1)
-
-    # Veritabanı Bilgisi
-    chats = len(await db.get_all_chats())
-    users = len(await db.get_all_users())
 
     def format_bytes(size):
         for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
@@ -209,45 +275,40 @@ async def sys_stats(client: Client, message: types.Message) -> None:
 <b>⚙️ {client.me.first_name} Sistem Bilgileri</b>
 ━━━━━━━━━━━━━━━━━━━━
 <b>🕒 Çalışma Süresi:</b> <code>{uptime}</code>
-<b>📈 Yük Ortalaması:</b> <code>{load_avg}</code>
-<b>🧠 CPU Kullanımı:</b> <code>{cpu_percent}%</code>
+<b>📈 Yük Ortalaması:</b> <code>{stats['load_avg']}</code>
+<b>🧠 CPU Kullanımı:</b> <code>{stats['cpu_percent']}%</code>
 
 <b>💬 Veritabanı:</b>
 • Sohbetler: <code>{chats:,}</code>
 • Kullanıcılar: <code>{users:,}</code>
 
-<b>📦 Yazılım Sürümleri:</b>
-• Python: <code>{pyver.split()[0]}</code>
-• Pyrogram: <code>{pyrover}</code>
-• PyTgCalls: <code>{pytgver}</code>
-• NTgCalls: <code>{ntgver}</code>
-• PyTdBot: <code>{py_td_ver}</code>
+{_VERSIONS_TEXT}
 
 <b>🖥️ Sistem Bilgisi:</b>
-• Sistem: <code>{system} {release}</code>
-• Mimari: <code>{architecture}</code>
-• İşlemci: <code>{processor}</code>
-• Hostname: <code>{hostname}</code>
-• IP Adresi: <tg-spoiler>{ip_address}</tg-spoiler>
-• MAC: <code>{mac_address}</code>
+• Sistem: <code>{stats['system']} {stats['release']}</code>
+• Mimari: <code>{stats['architecture']}</code>
+• İşlemci: <code>{stats['processor']}</code>
+• Hostname: <code>{stats['hostname']}</code>
+• IP Adresi: <tg-spoiler>{stats['ip_address']}</tg-spoiler>
+• MAC: <code>{stats['mac_address']}</code>
 
 <b>💾 Bellek:</b>
-• RAM: <code>{ram.used / (1024 ** 3):.2f} / {ram.total / (1024 ** 3):.2f} GiB ({ram.percent}%)</code>
+• RAM: <code>{stats['ram'].used / (1024 ** 3):.2f} / {stats['ram'].total / (1024 ** 3):.2f} GiB ({stats['ram'].percent}%)</code>
 
 <b>🔧 CPU:</b>
-• Çekirdek: <code>{cores_physical} fiziksel, {cores_total} mantıksal</code>
-• Frekans: <code>{cpu_freq_str}</code>
+• Çekirdek: <code>{stats['cores_physical']} fiziksel, {stats['cores_total']} mantıksal</code>
+• Frekans: <code>{stats['cpu_freq_str']}</code>
 
 <b>💽 Disk:</b>
-• Toplam: <code>{disk.total / (1024 ** 3):.2f} GiB</code>
-• Kullanılan: <code>{disk.used / (1024 ** 3):.2f} GiB ({disk.percent}%)</code>
-• Boş: <code>{disk.free / (1024 ** 3):.2f} GiB</code>
-• G/Ç: <code>Okuma: {format_bytes(disk_io.read_bytes)} | Yazma: {format_bytes(disk_io.write_bytes)}</code>
+• Toplam: <code>{stats['disk'].total / (1024 ** 3):.2f} GiB</code>
+• Kullanılan: <code>{stats['disk'].used / (1024 ** 3):.2f} GiB ({stats['disk'].percent}%)</code>
+• Boş: <code>{stats['disk'].free / (1024 ** 3):.2f} GiB</code>
+• G/Ç: <code>Okuma: {format_bytes(stats['disk_io'].read_bytes)} | Yazma: {format_bytes(stats['disk_io'].write_bytes)}</code>
 
 <b>🌐 Ağ:</b>
-• Gönderilen: <code>{format_bytes(net_io.bytes_sent)}</code>
-• Alınan: <code>{format_bytes(net_io.bytes_recv)}</code>
-• Arayüz: <code>{len(net_if)} aktif</code>
+• Gönderilen: <code>{format_bytes(stats['net_io'].bytes_sent)}</code>
+• Alınan: <code>{format_bytes(stats['net_io'].bytes_recv)}</code>
+• Arayüz: <code>{len(stats['net_if'])} aktif</code>
 """
 
     reply = await sys_msg.edit_text(response, disable_web_page_preview=True)
@@ -2,6 +2,7 @@
 # GNU AGPL v3.0 Lisansı altında lisanslanmıştır: https://www.gnu.org/licenses/agpl-3.0.html
 # TgMusicBot projesinin bir parçasıdır. Uygulanabilir yerlerde tüm hakları saklıdır.
 
+import asyncio
 import re
 from pytdbot import Client, types
 from pytdbot import filters
@@ -59,13 +60,13 @@ def _get_platform_url(platform: str, track_id: str) -> str:
 def build_song_selection_message(user_by: str, tracks: list[MusicTrack]):
     """Kullanıcıya şarkı seçme menüsü oluşturur."""
     text = f"{user_by}, bir şarkı seç 👇" if user_by else "Bir şarkı seç 👇"
+    btn = types.InlineKeyboardButton
+    callback = types.InlineKeyboardButtonTypeCallback
     buttons = [
         [
-            types.InlineKeyboardButton(
+            btn(
                 text=f"{track.name[:18]} - {track.artist}",
-                type=types.InlineKeyboardButtonTypeCallback(
-                    f"play_{track.platform.lower()}_{track.id}".encode()
-                ),
+                type=callback(f"play_{track.platform.lower()}_{track.id}".encode()),
             )
         ]
         for track in tracks[:4]
@@ -283,17 +284,21 @@ async def handle_play_command(c: Client, msg: types.Message, is_video=False):
     if not await is_admin(chat_id, c.me.id):
         return await msg.reply_text("⚠️ Müzik çalmak için yöneticilik izni gerekiyor. Lütfen beni yönetici yap ve tekrar dene.")
 
-    reply = await msg.getRepliedMessage() if msg.reply_to_message_id else None
+    # Durum mesajı, istek sahibi ve yanıtlanan mesaj birbirinden bağımsız; birlikte alınır
+    status_msg, requester, reply = await asyncio.gather(
+        msg.reply_text("🔍 İstek işleniyor..."),
+        msg.mention(),
+        # Yanıt yoksa sleep(0) hemen None döndürür
+        msg.getRepliedMessage() if msg.reply_to_message_id else asyncio.sleep(0),
+    )
     url = await get_url(msg, reply)
-
-    status_msg = await msg.reply_text("🔍 İstek işleniyor...")
     await del_msg(msg)
 
     args = extract_argument(msg.text)
     wrapper = (YouTubeData if is_video else DownloaderWrapper)(url or args)
-    requester = await msg.mention()
 
-    if not args and not url and (not reply or not tg.is_valid(reply)):
+    reply_is_media = tg.is_valid(reply)
+    if not args and not url and not reply_is_media:
         usage = (
             f"🎵 <b>Kullanım:</b>\n"
             f"/{'vplay' if is_video else 'play'} [şarkı adı | bağlantı]\n\n"
@@ -301,7 +306,7 @@ async def handle_play_command(c: Client, msg: types.Message, is_video=False):
         )
         return await edit_text(status_msg, text=usage, reply_markup=SupportButton)
 
-    if reply and tg.is_valid(reply):
+    if reply_is_media:
         return await _handle_telegram_file(c, reply, status_msg, requester)
 
     if url:
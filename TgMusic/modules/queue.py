@@ -33,6 +33,7 @@ async def queue_info(_: Client, msg: types.Message) -> None:
         return
 
     current_song = _queue[0]
+    played = sec_to_min(await call.played_time(chat.id))
     text = [
         f"<b>🎧 {chat.title} - Müzik Sırası</b>",
         "",
@@ -41,7 +42,7 @@ async def queue_info(_: Client, msg: types.Message) -> None:
         f"├ <b>İsteyen:</b> {current_song.user}",
         f"├ <b>Süre:</b> {sec_to_min(current_song.duration)} dk",
         f"├ <b>Döngü:</b> {'🔁 Açık' if current_song.loop else '➡️ Kapalı'}",
-        f"└ <b>İlerleme:</b> {sec_to_min(await call.played_time(chat.id))} dk",
+        f"└ <b>İlerleme:</b> {played} dk",
     ]
 
     # Sonraki şarkılar
@@ -65,7 +66,7 @@ async def queue_info(_: Client, msg: types.Message) -> None:
                 "",
                 "<b>▶️ Şu Anda Çalıyor:</b>",
                 f"├ <code>{current_song.name[:45]}</code>",
-                f"└ {sec_to_min(await call.played_time(chat.id))}/{sec_to_min(current_song.duration)} dk",
+                f"└ {played}/{sec_to_min(current_song.duration)} dk",
                 "",
                 f"<b>📊 Toplam:</b> {len(_queue)} şarkı sırada 🎶",
             ]
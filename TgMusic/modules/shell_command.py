@@ -69,12 +69,14 @@ async def shellrunner(message: types.Message) -> types.Ok | types.Error | types.
         else:
             stdout, stderr, retcode = await run_shell_command(command)
 
-            output = f"<b>🚀 Komut:</b> <code>{command}</code>\n"
+            # Büyük çıktılar her += ile yeniden kopyalanmasın diye parçalar tek seferde birleştirilir
+            output_parts = [f"<b>🚀 Komut:</b> <code>{command}</code>"]
             if stdout:
-                output += f"<b>📤 Çıktı:</b>\n<pre>{stdout}</pre>\n"
+                output_parts.append(f"<b>📤 Çıktı:</b>\n<pre>{stdout}</pre>")
             if stderr:
-                output += f"<b>❌ Hata:</b>\n<pre>{stderr}</pre>\n"
-            output += f"<b>🔢 Çıkış Kodu:</b> <code>{retcode}</code>"
+                output_parts.append(f"<b>❌ Hata:</b>\n<pre>{stderr}</pre>")
+            output_parts.append(f"<b>🔢 Çıkış Kodu:</b> <code>{retcode}</code>")
+            output = "\n".join(output_parts)
 
         # Boş çıktı kontrolü
         if not output.strip():
@@ -113,7 +115,7 @@ async def shellrunner(message: types.Message) -> types.Ok | types.Error | types.
 @Client.on_message(filters=Filter.command("sh"))
 async def shell_command(_: Client, m: types.Message) -> None:
     """Yalnızca sahip tarafından kullanılabilen terminal komutu çalıştırıcı."""
-    if int(m.from_id) != config.OWNER_ID:
+    if m.from_id != config.OWNER_ID:
         return None
 
     done = await shellrunner(m)
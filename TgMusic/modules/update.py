@@ -14,6 +14,8 @@ from TgMusic.core import chat_cache, call, Filter, config
 from TgMusic.logger import LOGGER
 from TgMusic.modules.utils.play_helpers import del_msg
 
+MAINTENANCE_CONCURRENCY = 10  # bakım bildirimi için aynı anda işlenen sohbet sayısı
+
 
 def is_docker():
     """Docker ortamında çalışıp çalışmadığını kontrol eder."""
@@ -101,17 +103,24 @@ async def update(c: Client, message: types.Message) -> None:
 
     # ──────────────── VC Temizliği ────────────────
     if active_vc := chat_cache.get_active_chats():
-        for chat_id in active_vc:
-            await call.end(chat_id)
-            await c.sendTextMessage(
-                chat_id,
-                "🔧 <b>Bakım Zamanı!</b>\n\n"
-                "Bot şu anda yeni özellikler için güncelleniyor veya yeniden başlatılıyor.\n"
-                "🎶 Müzik çalma işlemi geçici olarak durduruldu.\n"
-                "⏳ Lütfen birkaç saniye sonra tekrar deneyin.",
-                parse_mode="html",
-            )
-            await asyncio.sleep(0.5)
+        # Sohbetler sınırlı eşzamanlılıkla kapatılır; toplam gönderim hızı
+        # MAINTENANCE_CONCURRENCY / 0.5 sn ile sınırlı kalır
+        semaphore = asyncio.Semaphore(MAINTENANCE_CONCURRENCY)
+
+        async def _end_chat(chat_id: int) -> None:
+            async with semaphore:
+                await call.end(chat_id)
+                await c.sendTextMessage(
+                    chat_id,
+                    "🔧 <b>Bakım Zamanı!</b>\n\n"
+                    "Bot şu anda yeni özellikler için güncelleniyor veya yeniden başlatılıyor.\n"
+                    "🎶 Müzik çalma işlemi geçici olarak durduruldu.\n"
+                    "⏳ Lütfen birkaç saniye sonra tekrar deneyin.",
+                    parse_mode="html",
+                )
+                await asyncio.sleep(0.5)
+
+        await asyncio.gather(*(_end_chat(chat_id) for chat_id in active_vc))
 
     await msg.edit_text("♻️ Yeniden başlatma işlemi başlatılıyor...")
 
@@ -3,12 +3,30 @@
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 
 import asyncio
+import re
 from typing import Any, Union
 
 from pytdbot import types
 
 from TgMusic.logger import LOGGER
 
+_RETRY_AFTER_RE = re.compile(r"retry after (\d+)")
+
+
+def get_retry_after(error: types.Error, default: int) -> int:
+    """
+    Extracts the flood-wait delay from a 429 error message.
+
+    Args:
+        error (types.Error): The error returned by Telegram.
+        default (int): Delay to use when the message carries none.
+
+    Returns:
+        int: Seconds to wait before retrying.
+    """
+    match = _RETRY_AFTER_RE.search(error.message or "")
+    return int(match[1]) if match else default
+
 
 async def get_url(
         msg: types.Message, reply: Union[types.Message, None]
@@ -102,11 +120,7 @@ async def edit_text(
     reply = await reply_message.edit_text(*args, **kwargs)
     if isinstance(reply, types.Error):
         if reply.code == 429:
-            retry_after = (
-                int(reply.message.split("retry after ")[1])
-                if "retry after" in reply.message
-                else 2
-            )
+            retry_after = get_retry_after(reply, 2)
             LOGGER.warning("Rate limited, retrying in %s seconds", retry_after)
             if retry_after > 20:
                 return reply